@@ -1,13 +1,84 @@
 import sqlite3
+import sys
+from contextlib import closing
 from datetime import datetime, timedelta
 import os
 
-# Connect to the SQLite database
+from proj.utils.db_helpers import tune_connection
+
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = f"{CURRENT_DIR}/scm_db.sqlite"
+
+
+def _open():
+    """
+    Opens a tuned connection to the task database.
+
+    Each task opens its own short-lived connection, so no lock or read
+    snapshot is held between tasks and WAL checkpoints can run.
+    """
+    # Creates the file if it doesn't exist
+    conn = sqlite3.connect(DB_PATH)
+    # WAL, synchronous=NORMAL, busy timeout and a larger page cache
+    tune_connection(conn)
+    # Keep a transaction's dirty pages in memory rather than spilling them
+    # early
+    conn.execute("PRAGMA cache_spill=0")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# Rows pulled from the database per fetchmany() call when streaming
+BATCH_SIZE = 1000
+
+
+def _batches(cursor):
+    """
+    Yields a query's remaining rows BATCH_SIZE at a time.
+    """
+    return iter(lambda: cursor.fetchmany(BATCH_SIZE), [])
+
+
+# Lookups repeated across tasks, kept as constants so every call reuses the
+# same statement text
+SQL_CHECK_STOCK = "SELECT stock_quantity FROM Inventory WHERE product_id = ?"
+SQL_COMPONENT_STOCK = (
+    "SELECT stock_quantity FROM Components WHERE component_id = ?"
+)
+SQL_CHEAPEST_SUPPLIER = """
+            SELECT supplier_id, available_quantity, cost_per_unit
+            FROM SupplierComponents
+            WHERE component_id = ? AND available_quantity > 0
+            ORDER BY cost_per_unit ASC
+            LIMIT 1
+        """
+
+
+# Indexes for the task queries' WHERE, JOIN and ORDER BY columns. Orders and
+# OrderDetails lookups by order_id and Inventory by product_id are already
+# served by their primary keys.
+TASK_INDEXES = {
+    "ix_orders_status_date": "Orders(status, order_date)",
+    "ix_customers_name": "Customers(name)",
+    "ix_supplier_comp_cost": "SupplierComponents(component_id, cost_per_unit)",
+    "ix_shipping_dest_cost": "ShippingOptions(destination, cost)",
+}
 
-# Connect to SQLite database (creates the file if it doesn't exist)
-conn = sqlite3.connect(f"{CURRENT_DIR}/scm_db.sqlite")
-cursor = conn.cursor()
+
+def ensure_indexes():
+    """
+    Creates any missing TASK_INDEXES, then refreshes the planner statistics.
+    """
+    with closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = [name for name in TASK_INDEXES if name not in existing]
+        if not missing:
+            return
+        for name in missing:
+            cursor.execute(f"CREATE INDEX {name} ON {TASK_INDEXES[name]}")
+        cursor.execute("ANALYZE")
 
 
 # Task 1: Check the stock level of a specific product
@@ -15,15 +86,14 @@ def check_stock(product_id):
     """
     "Hi Ted, can you check how many units of the Smart Home Hub (P001) we currently have in stock?"
     """
-    cursor.execute(
-        "SELECT stock_quantity FROM Inventory WHERE product_id = ?",
-        (product_id,),
-    )
-    result = cursor.fetchone()
-    if result:
-        print(f"Stock level for product {product_id}: {result[0]}")
-    else:
-        print(f"Product {product_id} not found in inventory.")
+    with closing(_open()) as conn:
+        cursor = conn.cursor()
+        cursor.execute(SQL_CHECK_STOCK, (product_id,))
+        result = cursor.fetchone()
+        if result:
+            print(f"Stock level for product {product_id}: {result[0]}")
+        else:
+            print(f"Product {product_id} not found in inventory.")
 
 
 # Task 2: Find components running low on stock
@@ -32,17 +102,21 @@ def low_stock_components(threshold=50):
     "Ted, could you please find out if any components are running low on stock, say below 50 units?
      We need to ensure we don't run into shortages."
     """
-    cursor.execute(
-        "SELECT component_id, name, stock_quantity FROM Components WHERE stock_quantity < ?",
-        (threshold,),
-    )
-    results = cursor.fetchall()
-    if results:
-        print("Components running low on stock:")
-        for row in results:
-            print(f"Component ID: {row[0]}, Name: {row[1]}, Stock: {row[2]}")
-    else:
-        print("No components are running low on stock.")
+    with closing(_open()) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT component_id, name, stock_quantity FROM Components WHERE stock_quantity < ?",
+            (threshold,),
+        )
+        results = cursor.fetchall()
+        if results:
+            print("Components running low on stock:")
+            for row in results:
+                print(
+                    f"Component ID: {row[0]}, Name: {row[1]}, Stock: {row[2]}"
+                )
+        else:
+            print("No components are running low on stock.")
 
 
 # Task 3: Check for delayed orders
@@ -53,20 +127,24 @@ Let me know if any orders are delayed so we can take action."
 
 
 def delayed_orders(days=7):
-    cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-    cursor.execute(
-        "SELECT order_id, customer_id, order_date FROM Orders WHERE status = 'Pending' AND order_date < ?",
-        (cutoff_date,),
-    )
-    results = cursor.fetchall()
-    if results:
-        print("Delayed orders:")
-        for row in results:
-            print(
-                f"Order ID: {row[0]}, Customer ID: {row[1]}, Order Date: {row[2]}"
-            )
-    else:
-        print("No delayed orders found.")
+    with closing(_open()) as conn:
+        cursor = conn.cursor()
+        cutoff_date = (datetime.now() - timedelta(days=days)).strftime(
+            "%Y-%m-%d"
+        )
+        cursor.execute(
+            "SELECT order_id, customer_id, order_date FROM Orders WHERE status = 'Pending' AND order_date < ?",
+            (cutoff_date,),
+        )
+        results = cursor.fetchall()
+        if results:
+            print("Delayed orders:")
+            for row in results:
+                print(
+                    f"Order ID: {row[0]}, Customer ID: {row[1]}, Order Date: {row[2]}"
+                )
+        else:
+            print("No delayed orders found.")
 
 
 # Task 4: Expedite Orders for a Specific Customer
@@ -75,29 +153,88 @@ def expedite_orders(customer_name):
     "Hi Ted, can you check for any pending orders from ElectroWorld?
      Please prioritize them and expedite shipping if possible."
     """
+    with closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT o.order_id, o.status
+            FROM Orders o
+            JOIN Customers c ON o.customer_id = c.customer_id
+            WHERE c.name = ? AND o.status = 'Pending'
+        """,
+            (customer_name,),
+        )
+        results = cursor.fetchall()
+        if results:
+            print(f"Expediting orders for {customer_name}:")
+            order_updates = []
+            for order_id, status in results:
+                print(
+                    f"- Order ID: {order_id} (Status: {status}) - Marking as 'Expedited'"
+                )
+                order_updates.append((order_id,))
+            cursor.executemany(
+                "UPDATE Orders SET status = 'Expedited' WHERE order_id = ?",
+                order_updates,
+            )
+        else:
+            print(f"No pending orders found for {customer_name}.")
+
+
+# Pending order lines with their product's stock; formatted with the
+# comparison that decides whether the stock covers the line
+PENDING_LINES_SQL = """
+        SELECT od.order_id, od.product_id, od.quantity, i.stock_quantity
+        FROM OrderDetails od
+        JOIN Orders o ON od.order_id = o.order_id
+        JOIN Inventory i ON od.product_id = i.product_id
+        WHERE o.status = 'Pending' AND i.stock_quantity {} od.quantity
+    """
+
+
+# Larger batches would run into SQLite's bound parameter limit, so they go
+# through a temp table instead of a VALUES list
+MAX_VALUES_ROWS = 10000
+
+
+def _pairs_source(cursor, table, pairs):
+    """
+    Returns (sql, params) for a subquery that yields the given pairs as
+    column1, column2. Up to MAX_VALUES_ROWS pairs are bound into a VALUES
+    list; larger batches are loaded into the named temp table instead.
+    """
+    if len(pairs) <= MAX_VALUES_ROWS:
+        values = "VALUES " + ", ".join(["(?, ?)"] * len(pairs))
+        return values, [value for pair in pairs for value in pair]
     cursor.execute(
-        """
-        SELECT o.order_id, o.status
-        FROM Orders o
-        JOIN Customers c ON o.customer_id = c.customer_id
-        WHERE c.name = ? AND o.status = 'Pending'
+        f"CREATE TEMP TABLE IF NOT EXISTS {table} (column1, column2)"
+    )
+    cursor.execute(f"DELETE FROM temp.{table}")
+    cursor.executemany(f"INSERT INTO temp.{table} VALUES (?, ?)", pairs)
+    return f"SELECT column1, column2 FROM temp.{table}", []
+
+
+def _decrement_inventory(cursor, inv_updates):
+    """
+    Subtracts (quantity, product_id) pairs from Inventory in one UPDATE.
+    """
+    if not inv_updates:
+        return
+    deltas, params = _pairs_source(cursor, "deltas", inv_updates)
+    # Lines for the same product are summed, so each row is updated once
+    cursor.execute(
+        f"""
+        UPDATE Inventory
+        SET stock_quantity = stock_quantity - d.quantity
+        FROM (
+            SELECT column2 AS product_id, SUM(column1) AS quantity
+            FROM ({deltas})
+            GROUP BY column2
+        ) AS d
+        WHERE Inventory.product_id = d.product_id
     """,
-        (customer_name,),
+        params,
     )
-    results = cursor.fetchall()
-    if results:
-        print(f"Expediting orders for {customer_name}:")
-        for order_id, status in results:
-            print(
-                f"- Order ID: {order_id} (Status: {status}) - Marking as 'Expedited'"
-            )
-            cursor.execute(
-                "UPDATE Orders SET status = 'Expedited' WHERE order_id = ?",
-                (order_id,),
-            )
-        conn.commit()
-    else:
-        print(f"No pending orders found for {customer_name}.")
 
 
 # Task 5: Allocate Inventory for Pending Orders
@@ -106,34 +243,101 @@ def allocate_inventory():
     "Please go through all pending orders and allocate inventory where possible.
      For orders we can't fulfill, let me know the shortfall."
     """
-    cursor.execute(
-        """
-        SELECT od.order_id, od.product_id, od.quantity, i.stock_quantity
-        FROM OrderDetails od
-        JOIN Orders o ON od.order_id = o.order_id
-        JOIN Inventory i ON od.product_id = i.product_id
-        WHERE o.status = 'Pending'
+    log = []
+    # Lines are streamed from a separate connection; the writes stay
+    # uncommitted until the end, so the scan isn't affected by them
+    with closing(_open()) as reader, closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        # The stock check runs in SQL: one query per outcome
+        for batch in _batches(reader.execute(PENDING_LINES_SQL.format("<"))):
+            for row in batch:
+                log.append(
+                    f"Insufficient stock for {row['product_id']} on Order {row['order_id']}. Remaining: {row['stock_quantity']}."
+                )
+        for batch in _batches(reader.execute(PENDING_LINES_SQL.format(">="))):
+            _allocate_rows(cursor, batch, log)
+    _write_log(log)
+
+
+def _allocate_rows(cursor, rows, log):
     """
-    )
-    results = cursor.fetchall()
-    for order_id, product_id, quantity, stock in results:
+    Allocates stock to (order_id, product_id, quantity, stock) rows, adding
+    a message per row to log.
+    """
+    # Collect the updates and apply them as two batches in the caller's
+    # transaction
+    inv_updates = []
+    order_updates = []
+    for row in rows:
+        order_id, product_id = row["order_id"], row["product_id"]
+        quantity, stock = row["quantity"], row["stock_quantity"]
         if stock >= quantity:
-            print(
+            log.append(
                 f"Allocating {quantity} units of {product_id} for Order {order_id}."
             )
-            cursor.execute(
-                "UPDATE Inventory SET stock_quantity = stock_quantity - ? WHERE product_id = ?",
-                (quantity, product_id),
-            )
-            cursor.execute(
-                "UPDATE Orders SET status = 'Fulfilled' WHERE order_id = ?",
-                (order_id,),
-            )
+            inv_updates.append((quantity, product_id))
+            order_updates.append((order_id,))
         else:
-            print(
+            log.append(
                 f"Insufficient stock for {product_id} on Order {order_id}. Remaining: {stock}."
             )
-    conn.commit()
+    _decrement_inventory(cursor, inv_updates)
+    cursor.executemany(
+        "UPDATE Orders SET status = 'Fulfilled' WHERE order_id = ?",
+        order_updates,
+    )
+
+
+def _write_log(log):
+    """
+    Writes a task's buffered messages to stdout in a single call.
+    """
+    if log:
+        sys.stdout.write("\n".join(log) + "\n")
+
+
+INSERT_SCHEDULE_SQL = "INSERT INTO ProductionSchedule (schedule_id, product_id, start_date, end_date, quantity, status) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def _build_schedule_row(product_id, required_quantity):
+    """
+    Builds the ProductionSchedule row for a week-long production run.
+    """
+    now = datetime.now()
+    today = now.date().isoformat()
+    future_date = (now + timedelta(days=7)).date().isoformat()
+    return (
+        f"PS_{product_id}_{today}",
+        product_id,
+        today,
+        future_date,
+        required_quantity,
+        "Scheduled",
+    )
+
+
+def _component_shortfalls(cursor, runs):
+    """
+    Sums the component needs of (product_id, quantity) production runs in one
+    query and returns (component_id, shortfall) for the components that fall
+    short of them.
+    """
+    scheduled, params = _pairs_source(cursor, "runs", runs)
+    cursor.execute(
+        f"""
+        WITH scheduled(product_id, quantity) AS ({scheduled})
+        SELECT pc.component_id,
+               SUM(pc.quantity_needed_per_unit * s.quantity)
+                   - c.stock_quantity AS shortfall
+        FROM scheduled s
+        JOIN ProductComponents pc ON pc.product_id = s.product_id
+        JOIN Components c ON pc.component_id = c.component_id
+        GROUP BY pc.component_id
+        HAVING shortfall > 0
+    """,
+        params,
+    )
+    return cursor.fetchall()
 
 
 # Task 6: Schedule Production for a Product
@@ -142,23 +346,15 @@ def schedule_production(product_id, required_quantity):
     "Ted, could you schedule production for Smart Thermostats (P002) to fulfill the upcoming demand?
      Ensure production aligns with future orders."
     """
-    today = datetime.now().strftime("%Y-%m-%d")
-    future_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-    cursor.execute(
-        "INSERT INTO ProductionSchedule (schedule_id, product_id, start_date, end_date, quantity, status) VALUES (?, ?, ?, ?, ?, ?)",
-        (
-            f"PS_{product_id}_{today}",
-            product_id,
-            today,
-            future_date,
-            required_quantity,
-            "Scheduled",
-        ),
-    )
-    conn.commit()
-    print(
-        f"Scheduled production of {required_quantity} units for product {product_id}."
-    )
+    with closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            INSERT_SCHEDULE_SQL,
+            _build_schedule_row(product_id, required_quantity),
+        )
+        print(
+            f"Scheduled production of {required_quantity} units for product {product_id}."
+        )
 
 
 # Task 7: Order Components from Suppliers
@@ -168,30 +364,21 @@ def order_components(component_id, threshold):
     Check if we have enough for upcoming production.
     If not, order additional stock from the supplier with the best price."
     """
-    cursor.execute(
-        "SELECT stock_quantity FROM Components WHERE component_id = ?",
-        (component_id,),
-    )
-    stock = cursor.fetchone()
-    if stock and stock[0] < threshold:
-        cursor.execute(
-            """
-            SELECT supplier_id, available_quantity, cost_per_unit
-            FROM SupplierComponents
-            WHERE component_id = ? AND available_quantity > 0
-            ORDER BY cost_per_unit ASC
-        """,
-            (component_id,),
-        )
-        supplier = cursor.fetchone()
-        if supplier:
-            print(
-                f"Ordering {threshold - stock[0]} units of {component_id} from Supplier {supplier[0]} at {supplier[2]} per unit."
-            )
+    with closing(_open()) as conn:
+        cursor = conn.cursor()
+        cursor.execute(SQL_COMPONENT_STOCK, (component_id,))
+        stock = cursor.fetchone()
+        if stock and stock[0] < threshold:
+            cursor.execute(SQL_CHEAPEST_SUPPLIER, (component_id,))
+            supplier = cursor.fetchone()
+            if supplier:
+                print(
+                    f"Ordering {threshold - stock[0]} units of {component_id} from Supplier {supplier[0]} at {supplier[2]} per unit."
+                )
+            else:
+                print(f"No suppliers available for {component_id}.")
         else:
-            print(f"No suppliers available for {component_id}.")
-    else:
-        print(f"Stock for {component_id} is above the threshold.")
+            print(f"Stock for {component_id} is above the threshold.")
 
 
 # Task 8: Optimize Shipment Costs
@@ -199,21 +386,25 @@ def optimize_shipment(destination):
     """
     "Can you review shipping options for pending deliveries to Los Angeles and pick the most cost-effective carrier?"
     """
-    cursor.execute(
-        """
-        SELECT shipping_option_id, cost, estimated_days
-        FROM ShippingOptions
-        WHERE destination = ?
-        ORDER BY cost ASC
-    """,
-        (destination,),
-    )
-    options = cursor.fetchall()
-    if options:
-        best_option = options[0]
-        print(f"Cheapest shipping option to {destination}: {best_option}")
-    else:
-        print(f"No shipping options available to {destination}.")
+    with closing(_open()) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT shipping_option_id, cost, estimated_days
+            FROM ShippingOptions
+            WHERE destination = ?
+            ORDER BY cost ASC
+            LIMIT 1
+        """,
+            (destination,),
+        )
+        best_option = cursor.fetchone()
+        if best_option:
+            print(
+                f"Cheapest shipping option to {destination}: {tuple(best_option)}"
+            )
+        else:
+            print(f"No shipping options available to {destination}.")
 
 
 # Task 9: Prioritize a Customer's Shipments
@@ -222,19 +413,26 @@ def prioritize_customer_shipments(customer_name):
     "Ted, ensure that all pending shipments for ElectroWorld are prioritized.
      If necessary, adjust inventory and production schedules to accommodate them."
     """
-    cursor.execute(
-        """
-        SELECT o.order_id
-        FROM Orders o
-        JOIN Customers c ON o.customer_id = c.customer_id
-        WHERE c.name = ? AND o.status = 'Pending'
-    """,
-        (customer_name,),
-    )
-    orders = cursor.fetchall()
-    for order in orders:
-        allocate_inventory()
-        print(f"Prioritized fulfillment for Order ID {order[0]}.")
+    log = []
+    with closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        # Allocate only this customer's pending order lines, in a single pass
+        cursor.execute(
+            """
+            SELECT od.order_id, od.product_id, od.quantity, i.stock_quantity
+            FROM OrderDetails od
+            JOIN Orders o ON od.order_id = o.order_id
+            JOIN Customers c ON o.customer_id = c.customer_id
+            JOIN Inventory i ON od.product_id = i.product_id
+            WHERE c.name = ? AND o.status = 'Pending'
+        """,
+            (customer_name,),
+        )
+        rows = cursor.fetchall()
+        _allocate_rows(cursor, rows, log)
+        for order_id in dict.fromkeys(row[0] for row in rows):
+            log.append(f"Prioritized fulfillment for Order ID {order_id}.")
+    _write_log(log)
 
 
 # Task 10: Fulfill All Pending Orders
@@ -243,35 +441,57 @@ def fulfill_all_orders():
     "Please ensure all pending orders are fulfilled as soon as possible.
      If there’s not enough inventory, schedule production or arrange for additional components, and let me know the plan."
     """
-    cursor.execute(
-        """
-        SELECT od.order_id, od.product_id, od.quantity, i.stock_quantity
-        FROM OrderDetails od
-        JOIN Orders o ON od.order_id = o.order_id
-        JOIN Inventory i ON od.product_id = i.product_id
-        WHERE o.status = 'Pending'
-    """
-    )
-    orders = cursor.fetchall()
-    for order_id, product_id, quantity, stock in orders:
-        if stock >= quantity:
-            print(
-                f"Allocating {quantity} units of {product_id} for Order {order_id}."
-            )
-            cursor.execute(
-                "UPDATE Inventory SET stock_quantity = stock_quantity - ? WHERE product_id = ?",
-                (quantity, product_id),
-            )
-            cursor.execute(
+    # Messages are written once the plan is committed
+    log = []
+    runs = []
+    # Lines are streamed from a separate connection and each batch's writes
+    # go out as it arrives; they stay uncommitted until the end, so the scan
+    # isn't affected by them
+    with closing(_open()) as reader, closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        to_allocate = reader.execute(PENDING_LINES_SQL.format(">="))
+        for batch in _batches(to_allocate):
+            inv_updates = []
+            order_updates = []
+            for row in batch:
+                log.append(
+                    f"Allocating {row['quantity']} units of {row['product_id']} for Order {row['order_id']}."
+                )
+                inv_updates.append((row["quantity"], row["product_id"]))
+                order_updates.append((row["order_id"],))
+            _decrement_inventory(cursor, inv_updates)
+            cursor.executemany(
                 "UPDATE Orders SET status = 'Fulfilled' WHERE order_id = ?",
-                (order_id,),
-            )
-        else:
-            print(
-                f"Order {order_id} requires more stock for {product_id}. Scheduling production."
+                order_updates,
             )
-            schedule_production(product_id, quantity - stock)
-    conn.commit()
+
+        to_schedule = reader.execute(PENDING_LINES_SQL.format("<"))
+        for batch in _batches(to_schedule):
+            schedule_rows = []
+            for row in batch:
+                order_id, product_id = row["order_id"], row["product_id"]
+                shortfall = row["quantity"] - row["stock_quantity"]
+                log.append(
+                    f"Order {order_id} requires more stock for {product_id}. Scheduling production."
+                )
+                schedule_rows.append(
+                    _build_schedule_row(product_id, shortfall)
+                )
+                runs.append((product_id, shortfall))
+                log.append(
+                    f"Scheduled production of {shortfall} units for product {product_id}."
+                )
+            # The production runs are written in the same transaction as
+            # the allocations
+            cursor.executemany(INSERT_SCHEDULE_SQL, schedule_rows)
+
+        # Check the components for all the new production runs together
+        if runs:
+            for component_id, shortfall in _component_shortfalls(cursor, runs):
+                log.append(
+                    f"Component {component_id} is short by {shortfall} units for the scheduled production."
+                )
+    _write_log(log)
 
 
 # Task 11: Increase Order Quantity and Plan Fulfillment
@@ -283,137 +503,128 @@ def increase_order_and_plan(customer_name, product_id, new_quantity):
         If not, schedule new production and ensure we have enough components.
         Finally, prepare a message to the customer detailing what we can ship now, what will be ready next week, and what’s on backlog.
     """
-    # Step 1: Find the customer
-    cursor.execute(
-        "SELECT customer_id FROM Customers WHERE name = ?", (customer_name,)
-    )
-    customer = cursor.fetchone()
-    if not customer:
-        print(f"Customer {customer_name} not found.")
-        return
-    customer_id = customer[0]
-
-    # Step 2: Increase the order quantity
-    order_id = (
-        f"NEW_ORDER_{datetime.now().strftime('%Y%m%d%H%M%S')}"  # Unique ID
-    )
-    cursor.execute(
-        """
-        INSERT INTO Orders (order_id, customer_id, order_date, status) VALUES (?, ?, ?, ?)
-    """,
-        (
-            order_id,
-            customer_id,
-            datetime.now().strftime("%Y-%m-%d"),
-            "Pending",
-        ),
-    )
-    cursor.execute(
-        """
-        INSERT INTO OrderDetails (order_id, product_id, quantity) VALUES (?, ?, ?)
-    """,
-        (order_id, product_id, new_quantity),
-    )
-    conn.commit()
-    print(
-        f"Order {order_id} created for {new_quantity} units of product {product_id}."
-    )
-
-    # Step 3: Check inventory for immediate allocation
-    cursor.execute(
-        "SELECT stock_quantity FROM Inventory WHERE product_id = ?",
-        (product_id,),
-    )
-    inventory = cursor.fetchone()
-    allocated_quantity = 0
-    if inventory and inventory[0] > 0:
-        allocated_quantity = min(new_quantity, inventory[0])
+    with closing(_open()) as conn, conn:
+        cursor = conn.cursor()
+        # One clock reading for every date and ID this plan writes
+        now = datetime.now()
+        today = now.date().isoformat()
+        timestamp = now.strftime("%Y%m%d%H%M%S")
+
+        # Step 1: Find the customer
         cursor.execute(
-            """
-            UPDATE Inventory SET stock_quantity = stock_quantity - ? WHERE product_id = ?
-        """,
-            (allocated_quantity, product_id),
-        )
-        new_quantity -= allocated_quantity
-        conn.commit()
-        print(f"Allocated {allocated_quantity} units from inventory.")
-
-    # Step 4: Check existing production schedules
-    cursor.execute(
-        """
-        SELECT SUM(quantity) FROM ProductionSchedule
-        WHERE product_id = ? AND status IN ('Scheduled', 'In Progress')
-        AND start_date >= ?
-    """,
-        (product_id, datetime.now().strftime("%Y-%m-%d")),
-    )
-    scheduled_quantity = cursor.fetchone()[0] or 0
-
-    if scheduled_quantity >= new_quantity:
-        print(
-            f"Scheduled production can cover the remaining {new_quantity} units."
-        )
-    else:
-        # Step 5: Schedule additional production
-        additional_quantity = new_quantity - scheduled_quantity
-        schedule_id = (
-            f"PS_{product_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            "SELECT customer_id FROM Customers WHERE name = ?",
+            (customer_name,),
         )
-        start_date = datetime.now().strftime("%Y-%m-%d")
-        end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+        customer = cursor.fetchone()
+        if not customer:
+            print(f"Customer {customer_name} not found.")
+            return
+        customer_id = customer[0]
+
+        # Step 2: Increase the order quantity
+        order_id = f"NEW_ORDER_{timestamp}"  # Unique ID
         cursor.execute(
             """
-            INSERT INTO ProductionSchedule (schedule_id, product_id, start_date, end_date, quantity, status)
-            VALUES (?, ?, ?, ?, ?, ?)
+            INSERT INTO Orders (order_id, customer_id, order_date, status) VALUES (?, ?, ?, ?)
         """,
             (
-                schedule_id,
-                product_id,
-                start_date,
-                end_date,
-                additional_quantity,
-                "Scheduled",
+                order_id,
+                customer_id,
+                today,
+                "Pending",
             ),
         )
-        conn.commit()
+        cursor.execute(
+            """
+            INSERT INTO OrderDetails (order_id, product_id, quantity) VALUES (?, ?, ?)
+        """,
+            (order_id, product_id, new_quantity),
+        )
         print(
-            f"Scheduled additional production for {additional_quantity} units."
+            f"Order {order_id} created for {new_quantity} units of product {product_id}."
         )
 
-    # Step 6: Check components availability for production
-    cursor.execute(
-        """
-        SELECT pc.component_id, pc.quantity_needed_per_unit, c.stock_quantity
-        FROM ProductComponents pc
-        JOIN Components c ON pc.component_id = c.component_id
-        WHERE pc.product_id = ?
-    """,
-        (product_id,),
-    )
-    components = cursor.fetchall()
-    for component_id, needed_per_unit, stock_quantity in components:
-        required_quantity = needed_per_unit * additional_quantity
-        if stock_quantity < required_quantity:
+        # Step 3: Check inventory for immediate allocation
+        cursor.execute(SQL_CHECK_STOCK, (product_id,))
+        inventory = cursor.fetchone()
+        allocated_quantity = 0
+        if inventory and inventory[0] > 0:
+            allocated_quantity = min(new_quantity, inventory[0])
+            cursor.execute(
+                """
+                UPDATE Inventory SET stock_quantity = stock_quantity - ? WHERE product_id = ?
+            """,
+                (allocated_quantity, product_id),
+            )
+            new_quantity -= allocated_quantity
+            print(f"Allocated {allocated_quantity} units from inventory.")
+
+        # Step 4: Check existing production schedules
+        cursor.execute(
+            """
+            SELECT SUM(quantity) FROM ProductionSchedule
+            WHERE product_id = ? AND status IN ('Scheduled', 'In Progress')
+            AND start_date >= ?
+        """,
+            (product_id, today),
+        )
+        scheduled_quantity = cursor.fetchone()[0] or 0
+
+        if scheduled_quantity >= new_quantity:
+            # Nothing extra to produce, so no components are needed either
+            additional_quantity = 0
             print(
-                f"Component {component_id} is short by {required_quantity - stock_quantity} units."
+                f"Scheduled production can cover the remaining {new_quantity} units."
             )
         else:
-            print(f"Component {component_id} is sufficient.")
-
-    # Step 7: Generate customer message
-    message = (
-        f"Dear {customer_name},\n\n"
-        f"Your order for {new_quantity + allocated_quantity} units of {product_id}:\n"
-        f"- {allocated_quantity} units will be shipped immediately.\n"
-        f"- {scheduled_quantity if scheduled_quantity >= new_quantity else additional_quantity} units are scheduled for production and will be ready next week.\n"
-        f"- Remaining {new_quantity - scheduled_quantity if new_quantity > scheduled_quantity else 0} units are on backlog.\n\n"
-        "Thank you for your patience.\n"
-    )
-    print("\nCustomer Message:")
-    print(message)
+            # Step 5: Schedule additional production
+            additional_quantity = new_quantity - scheduled_quantity
+            schedule_id = f"PS_{product_id}_{timestamp}"
+            start_date = today
+            end_date = (now + timedelta(days=7)).date().isoformat()
+            cursor.execute(
+                """
+                INSERT INTO ProductionSchedule (schedule_id, product_id, start_date, end_date, quantity, status)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    schedule_id,
+                    product_id,
+                    start_date,
+                    end_date,
+                    additional_quantity,
+                    "Scheduled",
+                ),
+            )
+            print(
+                f"Scheduled additional production for {additional_quantity} units."
+            )
+
+        # Step 6: Check components availability for production
+        shortfalls = _component_shortfalls(
+            cursor, [(product_id, additional_quantity)]
+        )
+        for component_id, shortfall in shortfalls:
+            print(f"Component {component_id} is short by {shortfall} units.")
+        if not shortfalls:
+            print("All components are sufficient.")
+
+        # Step 7: Generate customer message
+        message = (
+            f"Dear {customer_name},\n\n"
+            f"Your order for {new_quantity + allocated_quantity} units of {product_id}:\n"
+            f"- {allocated_quantity} units will be shipped immediately.\n"
+            f"- {scheduled_quantity if scheduled_quantity >= new_quantity else additional_quantity} units are scheduled for production and will be ready next week.\n"
+            f"- Remaining {new_quantity - scheduled_quantity if new_quantity > scheduled_quantity else 0} units are on backlog.\n\n"
+            "Thank you for your patience.\n"
+        )
+        print("\nCustomer Message:")
+        print(message)
 
 
 # Execute the tasks
+ensure_indexes()
+
 print("Task 1: Check Stock")
 check_stock("P001")  # Replace 'P001' with another product ID if needed
 
@@ -447,6 +658,3 @@ check_stock("P001")  # Replace 'P001' with another product ID if needed
 
 # print("\nTask 11: Increase Order Quantity and Plan Fulfillment")
 # increase_order_and_plan("ElectroWorld", "P002", 100)
-
-# Close the database connection
-conn.close()
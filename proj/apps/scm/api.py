@@ -1,23 +1,149 @@
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+from proj.dsl.dsl_namespace import DSLNamespace, read_only_step
+
+# Report statements shared by the generate_* and iter_* variants
+_REPLENISHMENT_REPORT_QUERY = "SELECT component_id, name, stock_quantity FROM Components WHERE stock_quantity < ?"
+
+_PRODUCTION_REPORT_QUERY = """
+    SELECT schedule_id, product_id, start_date, end_date, total_capacity AS quantity, status
+    FROM ProductionSchedule
+    WHERE start_date >= ? AND end_date <= ?
+"""
+
+# generate_order_report's statement for each (status, customer_id) filter
+# combination, built once so every call reuses an identical, already prepared
+# string instead of concatenating a new one
+_ORDER_REPORT_QUERIES = {
+    (False, False): "SELECT order_id, customer_id, order_date, status FROM Orders",
+    (True, False): "SELECT order_id, customer_id, order_date, status FROM Orders WHERE status = ?",
+    (False, True): "SELECT order_id, customer_id, order_date, status FROM Orders WHERE customer_id = ?",
+    (True, True): "SELECT order_id, customer_id, order_date, status FROM Orders WHERE status = ? AND customer_id = ?",
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_date(date_str):
+    """
+    Parses a YYYY-MM-DD string, memoized since schedules share few dates.
+
+    Args:
+        date_str (str): The date to parse.
+
+    Returns:
+        datetime: The parsed date.
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@contextmanager
+def _transaction(cursor):
+    """
+    Runs the enclosed statements as one IMMEDIATE transaction.
+
+    Multi-statement writes then pay a single commit instead of one per
+    statement. If the caller already has a transaction open, the block joins
+    it under a savepoint and leaves the commit to the caller; a block that
+    raises is still undone as a whole.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor the statements are executed on.
+
+    Returns:
+        None
+    """
+    connection = cursor.connection
+    if connection.in_transaction:
+        # On the connection, so a result pending on the cursor isn't reset
+        connection.execute("SAVEPOINT scm_tx")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK TO scm_tx")
+            connection.execute("RELEASE scm_tx")
+            raise
+        connection.execute("RELEASE scm_tx")
+        return
+
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.rollback()
+        raise
+    connection.commit()
+
+
+def _streaming_cursor(cursor):
+    """
+    Opens a second cursor on the same connection for lazily consumed queries.
+
+    Args:
+        cursor (sqlite3.Cursor): The API's shared cursor.
+
+    Returns:
+        sqlite3.Cursor: A new cursor with the same row factory.
+    """
+    streaming_cursor = cursor.connection.cursor()
+    streaming_cursor.row_factory = cursor.row_factory
+    return streaming_cursor
+
+
+def _fetch_columns(cursor):
+    """
+    Fetches the rest of a query's result as one list per column.
+
+    Args:
+        cursor (sqlite3.Cursor): A cursor with an executed query.
+
+    Returns:
+        dict: Column name mapped to the list of that column's values.
+    """
+    names = [column[0] for column in cursor.description]
+    columns = [list(column) for column in zip(*cursor.fetchall())]
+    return dict(zip(names, columns or [[] for _ in names]))
 
 
 class SCMAPI:
-    def __init__(self, cursor):
+    def __init__(self, cursor, read_cursor=None):
+        """
+        Binds the API to a database cursor.
+
+        The connection is tuned once by whoever opens it (see
+        tune_connection), not here, so rebuilding the API on the same
+        connection doesn't re-run the PRAGMAs.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor on a read-write connection.
+            read_cursor (sqlite3.Cursor, optional): Cursor on a read-only
+                connection (see connect_read_only) to serve the reports from.
+                Reports then only see committed data. Defaults to cursor.
+        """
         self.cursor = cursor
+        # Rows map straight onto the result dicts, and still unpack as tuples
+        cursor.row_factory = sqlite3.Row
+        if read_cursor is not None:
+            read_cursor.row_factory = sqlite3.Row
         self.product = Product(cursor)
         self.customer = Customer(cursor)
-        self.customer_order = CustomerOrder(cursor)
+        self.shipping = Shipping(cursor)
+        self.customer_order = CustomerOrder(cursor, shipping=self.shipping)
         self.inventory = Inventory(cursor)
         self.production = Production(cursor)
-        self.shipping = Shipping(cursor)
         self.component = Component(cursor)
-        self.report = Report(cursor)
+        self.report = Report(read_cursor or cursor)
 
 
-class Customer:
+class Customer(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
+        # No API method writes Customers, so lookups are safe to memoize
+        self._cached_customer_details = lru_cache(maxsize=512)(
+            self._get_customer_details_uncached
+        )
 
     def get_customer_details(self, customer_id: str) -> dict:
         """
@@ -52,6 +178,9 @@ class Customer:
         output_var: customer_details
         ```
         """
+        return dict(self._cached_customer_details(customer_id))
+
+    def _get_customer_details_uncached(self, customer_id):
         self.cursor.execute(
             """
             SELECT name, address, contact_info
@@ -61,16 +190,14 @@ class Customer:
             (customer_id,),
         )
         row = self.cursor.fetchone()
-        return (
-            {"name": row[0], "address": row[1], "contact_info": row[2]}
-            if row
-            else {}
-        )
+        return dict(row) if row else {}
 
 
-class Product:
+class Product(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
+        # No API method writes Products, so the catalogue is loaded once
+        self._products = None
 
     def get_products(self) -> list[dict]:
         """
@@ -101,17 +228,22 @@ class Product:
           output_var: products
         ```
         """
-        self.cursor.execute("SELECT product_id, name, price FROM Products")
-        rows = self.cursor.fetchall()
-        return [
-            {"product_id": row[0], "name": row[1], "price": row[2]}
-            for row in rows
-        ]
+        if self._products is None:
+            self.cursor.execute(
+                "SELECT product_id, name, price FROM Products"
+            )
+            self._products = [dict(row) for row in self.cursor.fetchall()]
+        return [dict(product) for product in self._products]
 
 
-class CustomerOrder:
-    def __init__(self, cursor):
+class CustomerOrder(DSLNamespace):
+    def __init__(self, cursor, shipping=None):
         self.cursor = cursor
+        # Shipping options are looked up through Orders, so order writes
+        # must invalidate the shipping cache
+        self.shipping = shipping
+        # Last numeric order ID handed out, primed from Orders on first use
+        self._last_order_number = None
 
     def partial_allocate_order(self, order_id: str) -> dict:
         """
@@ -145,37 +277,41 @@ class CustomerOrder:
           output_var: partial_allocation
         ```
         """
-        self.cursor.execute(
-            """
-            SELECT od.product_id, od.quantity as requested_quantity, i.stock_quantity
-            FROM OrderDetails od
-            LEFT JOIN Inventory i ON od.product_id = i.product_id
-            WHERE od.order_id = ?
-            """,
-            (order_id,),
-        )
-        rows = self.cursor.fetchall()
-        allocations = []
-
-        for product_id, quantity, stock in rows:
-            allocated = min(quantity, stock)
-            allocations.append(
+        with _transaction(self.cursor):
+            self.cursor.execute(
+                """
+                SELECT od.product_id, od.quantity as requested_quantity,
+                MIN(od.quantity, COALESCE(i.stock_quantity, 0))
+                FROM OrderDetails od
+                LEFT JOIN Inventory i ON od.product_id = i.product_id
+                WHERE od.order_id = ?
+                """,
+                (order_id,),
+            )
+            allocations = [
                 {
                     "product_id": product_id,
                     "requested_quantity": quantity,
                     "allocated_quantity": allocated,
                 }
+                for product_id, quantity, allocated in self.cursor.fetchall()
+            ]
+
+            # Apply the same allocation to every product in one statement
+            self.cursor.execute(
+                """
+                UPDATE Inventory
+                SET stock_quantity = stock_quantity - MIN(Inventory.stock_quantity, od.quantity)
+                FROM OrderDetails od
+                WHERE od.order_id = ? AND od.product_id = Inventory.product_id
+                """,
+                (order_id,),
             )
             self.cursor.execute(
-                "UPDATE Inventory SET stock_quantity = stock_quantity - ? WHERE product_id = ?",
-                (allocated, product_id),
+                "UPDATE Orders SET status = ? WHERE order_id = ?",
+                ("Partially Allocated", order_id),
             )
-
-        self.cursor.execute(
-            "UPDATE Orders SET status = ? WHERE order_id = ?",
-            ("Partially Allocated", order_id),
-        )
-        return allocations
+            return allocations
 
     def get_order_status(self, order_id: str) -> str:
         """
@@ -201,10 +337,10 @@ class CustomerOrder:
           output_var: order_status
         ```
         """
-        self.cursor.execute(
-            "SELECT status FROM Orders WHERE order_id = ?", (order_id,)
-        )
-        result = self.cursor.fetchone()
+        result = self.cursor.execute(
+            "SELECT status FROM Orders WHERE order_id = ? LIMIT 1",
+            (order_id,),
+        ).fetchone()
         return result[0] if result else "Order not found"
 
     def get_pending_orders(self, customer_id: str = None) -> list[dict]:
@@ -239,20 +375,34 @@ class CustomerOrder:
           output_var: pending_orders
         ```
         """
+        return list(self.iter_pending_orders(customer_id))
+
+    def iter_pending_orders(self, customer_id: str = None):
+        """
+        Streams pending orders, optionally filtered by customer.
+
+        Rows are read from the cursor as they are consumed rather than being
+        materialized up front. A dedicated cursor is used so other API calls
+        can run while the iterator is being consumed.
+
+        Args:
+            customer_id (str, optional): The ID of the customer to filter orders. Defaults to None.
+
+        Yields:
+            dict: A pending order, shaped as in get_pending_orders.
+        """
+        cursor = _streaming_cursor(self.cursor)
         if customer_id:
-            self.cursor.execute(
+            cursor.execute(
                 "SELECT order_id, order_date, status FROM Orders WHERE status = 'Pending' AND customer_id = ?",
                 (customer_id,),
             )
         else:
-            self.cursor.execute(
+            cursor.execute(
                 "SELECT order_id, order_date, status FROM Orders WHERE status = 'Pending'"
             )
-        rows = self.cursor.fetchall()
-        return [
-            {"order_id": row[0], "order_date": row[1], "status": row[2]}
-            for row in rows
-        ]
+        for row in cursor:
+            yield dict(row)
 
     def update_order_status(self, order_id: str, status: str) -> bool:
         """
@@ -306,20 +456,130 @@ class CustomerOrder:
           output_var: new_order_id
         ```
         """
-        import uuid
-
-        order_id = str(uuid.uuid4())[:8]
-        self.cursor.execute(
-            "INSERT INTO Orders (order_id, customer_id, order_date, status) VALUES (?, ?, date('now'), 'Pending')",
-            (order_id, customer_id),
-        )
-        for detail in order_details:
-            self.cursor.execute(
+        with _transaction(self.cursor):
+            order_id = self._insert_order(customer_id)
+            self.cursor.executemany(
                 "INSERT INTO OrderDetails (order_id, product_id, quantity) VALUES (?, ?, ?)",
-                (order_id, detail["product_id"], detail["quantity"]),
+                (
+                    (order_id, detail["product_id"], detail["quantity"])
+                    for detail in order_details
+                ),
+            )
+        if self.shipping:
+            self.shipping._clear_cache()
+        return order_id
+
+    def create_orders(self, orders: list[dict]) -> list[str]:
+        """
+        Creates several orders at once, committing them in a single transaction.
+
+        Args:
+            orders (list[dict]): The orders to create, each with a customer_id
+                and its order_details as accepted by create_order.
+
+        Returns:
+            list[str]: The IDs of the newly created orders, in input order.
+
+        DSL Example:
+        ```
+        - name: Create Orders
+          function: customer_order.create_orders
+          arguments:
+            orders:
+              - customer_id: "C001"
+                order_details:
+                  - product_id: "P001"
+                    quantity: 10
+              - customer_id: "C002"
+                order_details:
+                  - product_id: "P002"
+                    quantity: 5
+                  - product_id: "P003"
+                    quantity: 20
+          output_var: new_order_ids
+        ```
+        """
+        with _transaction(self.cursor):
+            # Re-prime under the write lock, since another connection may
+            # have created orders since the counter was last read
+            self._last_order_number = None
+            order_ids = [self._next_order_id() for _ in orders]
+            detail_rows = [
+                (order_id, detail["product_id"], detail["quantity"])
+                for order_id, order in zip(order_ids, orders)
+                for detail in order["order_details"]
+            ]
+
+            self.cursor.executemany(
+                "INSERT INTO Orders (order_id, customer_id, order_date, status) VALUES (?, ?, date('now'), 'Pending')",
+                (
+                    (order_id, order["customer_id"])
+                    for order_id, order in zip(order_ids, orders)
+                ),
             )
+
+            # Insert details as multi-row VALUES statements of up to
+            # chunk_size rows each, so large imports dispatch few statements
+            chunk_size = 500
+            for start in range(0, len(detail_rows), chunk_size):
+                chunk = detail_rows[start : start + chunk_size]
+                values = ", ".join("(?, ?, ?)" for _ in chunk)
+                self.cursor.execute(
+                    f"INSERT INTO OrderDetails (order_id, product_id, quantity) VALUES {values}",
+                    [value for row in chunk for value in row],
+                )
+
+        if self.shipping:
+            self.shipping._clear_cache()
+        return order_ids
+
+    def _insert_order(self, customer_id):
+        """
+        Inserts a pending Orders row under the next sequential ID.
+
+        Another connection may already have used the cached number; in that
+        case the counter is re-primed and the insert retried. Callers hold the
+        write lock, so the retried ID can't be taken in the meantime.
+
+        Args:
+            customer_id (str): The ID of the customer placing the order.
+
+        Returns:
+            str: The ID of the inserted order.
+        """
+        insert_sql = "INSERT INTO Orders (order_id, customer_id, order_date, status) VALUES (?, ?, date('now'), 'Pending')"
+        try:
+            order_id = self._next_order_id()
+            self.cursor.execute(insert_sql, (order_id, customer_id))
+        except sqlite3.IntegrityError:
+            self._last_order_number = None
+            order_id = self._next_order_id()
+            self.cursor.execute(insert_sql, (order_id, customer_id))
         return order_id
 
+    def _next_order_id(self):
+        """
+        Generates the next sequential order ID (e.g. 'O004').
+
+        The counter is primed once from the highest existing 'O<number>' ID
+        and then incremented in memory, so creating an order costs no extra
+        query and IDs can't collide the way truncated UUIDs could.
+
+        Returns:
+            str: The new order ID.
+        """
+        if self._last_order_number is None:
+            result = self.cursor.execute(
+                """
+                SELECT MAX(CAST(SUBSTR(order_id, 2) AS INTEGER))
+                FROM Orders
+                WHERE order_id GLOB 'O[0-9]*'
+                """
+            ).fetchone()
+            self._last_order_number = result[0] or 0
+        self._last_order_number += 1
+        return f"O{self._last_order_number:03d}"
+
     def cancel_order(self, order_id: str) -> bool:
         """
         Cancels an order and updates any related allocations, inventory, and production schedules.
@@ -345,6 +605,8 @@ class CustomerOrder:
         self.cursor.execute(
             "DELETE FROM Orders WHERE order_id = ?", (order_id,)
         )
+        if self.shipping:
+            self.shipping._clear_cache()
         return self.cursor.rowcount > 0
 
     def get_order_details(self, order_id: str) -> list[dict]:
@@ -394,23 +656,14 @@ class CustomerOrder:
             """,
             (order_id,),
         )
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "product_id": row[0],
-                "quantity": row[1],
-                "allocated_quantity": row[2],
-                "remaining_quantity": row[3],
-                "order_date": row[4],
-            }
-            for row in rows
-        ]
+        return [dict(row) for row in self.cursor.fetchall()]
 
 
-class Inventory:
+class Inventory(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
 
+    @read_only_step
     def check_stock(self, product_id: str) -> int:
         """
         Checks the stock level of a specific product.
@@ -430,13 +683,47 @@ class Inventory:
           output_var: stock_level
         ```
         """
-        self.cursor.execute(
-            "SELECT stock_quantity FROM Inventory WHERE product_id = ?",
+        result = self.cursor.execute(
+            "SELECT stock_quantity FROM Inventory WHERE product_id = ? LIMIT 1",
             (product_id,),
-        )
-        result = self.cursor.fetchone()
+        ).fetchone()
         return result[0] if result else 0
 
+    @read_only_step
+    def check_stock_levels(self, product_ids: list[str]) -> dict:
+        """
+        Checks the stock levels of several products in one lookup.
+        Prefer this to looping over check_stock.
+
+        Args:
+            product_ids (list[str]): The IDs of the products to check.
+
+        Returns:
+            dict: Current stock level keyed by product ID (0 if unknown).
+            Example:
+            {
+                "P001": 15,
+                "P002": 6,
+            }
+
+        DSL Example:
+        ```
+        - name: Check Stock Levels
+          function: inventory.check_stock_levels
+          arguments:
+            product_ids: ["P001", "P002"]
+          output_var: stock_levels
+        ```
+        """
+        placeholders = ", ".join("?" for _ in product_ids)
+        self.cursor.execute(
+            f"SELECT product_id, stock_quantity FROM Inventory WHERE product_id IN ({placeholders})",
+            product_ids,
+        )
+        stock_levels = dict.fromkeys(product_ids, 0)
+        stock_levels.update(self.cursor.fetchall())
+        return stock_levels
+
     def allocate_stock(self, order_id: str) -> list[dict]:
         """
         Allocates available stock for a given order.
@@ -469,67 +756,71 @@ class Inventory:
           output_var: allocation_result
         ```
         """
-        self.cursor.execute(
-            """
-            SELECT od.product_id, od.remaining_quantity, i.available_quantity
-            FROM OrderDetails od
-            LEFT JOIN Inventory i ON od.product_id = i.product_id
-            WHERE od.order_id = ? 
-            """,
-            (order_id,),
-        )
-        allocations = []
-        rows = self.cursor.fetchall()
-
-        for (
-            product_id,
-            remaining_quantity,
-            available_quantity,
-        ) in rows:
-            allocated = min(remaining_quantity, available_quantity)
-            new_remaining_quantity = (
-                remaining_quantity - allocated
-            )  # Calculate dynamically
-            allocations.append(
-                {
-                    "product_id": product_id,
-                    "newly_allocated_quantity": allocated,
-                    "remaining_quantity": new_remaining_quantity,
-                }
-            )
+        with _transaction(self.cursor):
             self.cursor.execute(
                 """
-                UPDATE Inventory
-                SET reserved_quantity = reserved_quantity + ?
-                WHERE product_id = ?
+                SELECT od.product_id, od.remaining_quantity,
+                MIN(od.remaining_quantity, COALESCE(i.available_quantity, 0))
+                FROM OrderDetails od
+                LEFT JOIN Inventory i ON od.product_id = i.product_id
+                WHERE od.order_id = ?
                 """,
-                (allocated, product_id),
+                (order_id,),
             )
+            allocations = []
+            order_detail_updates = []
+            rows = self.cursor.fetchall()
+
+            for product_id, remaining_quantity, allocated in rows:
+                new_remaining_quantity = (
+                    remaining_quantity - allocated
+                )  # Calculate dynamically
+                allocations.append(
+                    {
+                        "product_id": product_id,
+                        "newly_allocated_quantity": allocated,
+                        "remaining_quantity": new_remaining_quantity,
+                    }
+                )
+                order_detail_updates.append((allocated, order_id, product_id))
 
+            # Reserve stock for every product in one statement; this has to
+            # run before OrderDetails changes the remaining quantities
             self.cursor.execute(
-                "UPDATE Orders SET status = ? WHERE order_id = ?",
-                (
-                    (
-                        "Allocated"
-                        if all(
-                            a["newly_allocated_quantity"] > 0
-                            for a in allocations
-                        )
-                        else "Partially Allocated"
-                    ),
-                    order_id,
-                ),
+                """
+                UPDATE Inventory
+                SET reserved_quantity = reserved_quantity + MIN(Inventory.available_quantity, od.remaining_quantity)
+                FROM OrderDetails od
+                WHERE od.order_id = ? AND od.product_id = Inventory.product_id
+                """,
+                (order_id,),
             )
-
-            self.cursor.execute(
+            self.cursor.executemany(
                 """UPDATE OrderDetails
                 SET allocated_quantity = allocated_quantity + ?
                 WHERE order_id = ? AND product_id = ?
                 """,
-                (allocated, order_id, product_id),
+                order_detail_updates,
             )
 
-        return allocations
+            # Set the order status once, after every line has been allocated
+            if allocations:
+                fully_allocated = all(
+                    a["remaining_quantity"] == 0 for a in allocations
+                )
+                self.cursor.execute(
+                    "UPDATE Orders SET status = ? WHERE order_id = ?",
+                    (
+                        (
+                            "Allocated"
+                            if fully_allocated
+                            else "Partially Allocated"
+                        ),
+                        order_id,
+                    ),
+                )
+
+            return allocations
 
     def adjust_stock(self, product_id: str, quantity_delta: int) -> bool:
         """
@@ -559,17 +850,23 @@ class Inventory:
         return self.cursor.rowcount > 0
 
 
-class Production:
+class Production(DSLNamespace):
 
     def __init__(self, cursor):
         self.cursor = cursor
 
-    def schedule_production(self, order_id: str) -> list[dict]:
+    def schedule_production(
+        self, order_id: str, allocate: bool = False
+    ) -> list[dict]:
         """
         Schedules production runs for an order's unallocated quantities.
 
         Args:
             order_id (str): The ID of the order to schedule production for.
+            allocate (bool, optional): Also allocate the new runs to the order,
+                saving a follow-up allocate_prebooked_production call. Call
+                allocate_prebooked_production first so existing capacity is
+                used before new runs are booked. Defaults to False.
 
         Returns:
             list[dict]: A list of newly created production schedule records.
@@ -602,6 +899,11 @@ class Production:
           output_var: production_schedule
         ```
         """
+        with _transaction(self.cursor):
+            return self._schedule_production(order_id, allocate)
+
+    def _schedule_production(self, order_id, allocate):
+        """schedule_production's body, run in the caller's transaction."""
         self.cursor.execute(
             """
             SELECT od.product_id, od.remaining_quantity
@@ -619,72 +921,148 @@ class Production:
             earliest_date_row[0] if earliest_date_row else "2025-01-01"
         )
 
+        # Find the latest production date for every product in one query
+        product_ids = [product_id for product_id, _ in rows]
+        placeholders = ", ".join("?" for _ in product_ids)
+        self.cursor.execute(
+            f"""
+            SELECT product_id, MAX(end_date)
+            FROM ProductionSchedule
+            WHERE product_id IN ({placeholders})
+            GROUP BY product_id
+            """,
+            product_ids,
+        )
+        latest_dates = dict(self.cursor.fetchall())
+
         production_schedules = []
+        schedule_rows = []
+        one_day = timedelta(days=1)
 
         for product_id, remaining_quantity in rows:
-            # Find the latest production date for this product
-            self.cursor.execute(
-                """
-                SELECT MAX(end_date)
-                FROM ProductionSchedule
-                WHERE product_id = ?
-                """,
-                (product_id,),
-            )
-            latest_date_row = self.cursor.fetchone()
-            latest_date = (
-                latest_date_row[0] if latest_date_row[0] else earliest_date
-            )
+            latest_date = latest_dates.get(product_id) or earliest_date
 
             # Calculate new production start and end dates
-            new_start_date = datetime.strptime(
-                latest_date, "%Y-%m-%d"
-            ) + timedelta(days=1)
-            new_end_date = (
-                new_start_date  # Assuming single-day production for now
-            )
+            new_start_date = _parse_date(latest_date) + one_day
+            start_date = new_start_date.strftime("%Y-%m-%d")
+            end_date = start_date  # Assuming single-day production for now
 
             # Generate a unique schedule ID
-            schedule_id = f"PS_{order_id}_{product_id}_{new_start_date.strftime('%Y%m%d')}"
+            schedule_id = (
+                f"PS_{order_id}_{product_id}_{start_date.replace('-', '')}"
+            )
 
-            # Insert the new production schedule
-            self.cursor.execute(
-                """
-                INSERT INTO ProductionSchedule (
-                    schedule_id, product_id, start_date, end_date, total_capacity, allocated_capacity, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+            schedule_rows.append(
                 (
                     schedule_id,
                     product_id,
-                    new_start_date.strftime("%Y-%m-%d"),
-                    new_end_date.strftime("%Y-%m-%d"),
+                    start_date,
+                    end_date,
                     remaining_quantity,
-                    0,  # No capacity allocated yet
+                    # The whole run is booked to the order when allocating
+                    remaining_quantity if allocate else 0,
                     "Scheduled",
-                ),
+                )
             )
 
-            # Add to the result
+        # Insert all the new production schedules in one batch
+        self.cursor.executemany(
+            """
+            INSERT INTO ProductionSchedule (
+                schedule_id, product_id, start_date, end_date, total_capacity, allocated_capacity, status
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            schedule_rows,
+        )
+
+        if allocate:
+            self._allocate_new_runs(order_id, schedule_rows)
+
+        for (
+            schedule_id,
+            product_id,
+            start_date,
+            end_date,
+            quantity,
+            _,
+            status,
+        ) in schedule_rows:
             production_schedules.append(
                 {
                     "schedule_id": schedule_id,
                     "product_id": product_id,
-                    "start_date": new_start_date.strftime("%Y-%m-%d"),
-                    "end_date": new_end_date.strftime("%Y-%m-%d"),
-                    "quantity": remaining_quantity,
-                    "status": "Scheduled",
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "quantity": quantity,
+                    "status": status,
                 }
             )
 
         return production_schedules
 
-    def get_production_backlog(self, product_id: str = None) -> list[dict]:
+    def _allocate_new_runs(self, order_id, schedule_rows):
+        """
+        Records freshly scheduled runs as allocated to the order.
+
+        Each run covers exactly the remaining quantity of its product, so it
+        matches what allocate_prebooked_production would book once existing
+        capacity is used up.
+        """
+        self.cursor.executemany(
+            """
+            INSERT INTO ProductionAllocation (allocation_id, production_schedule_id, order_id, allocated_quantity)
+            VALUES (?, ?, ?, ?)
+            """,
+            [
+                (
+                    f"PA_{schedule_id}_{order_id}",
+                    schedule_id,
+                    order_id,
+                    quantity,
+                )
+                for schedule_id, _, _, _, quantity, _, _ in schedule_rows
+            ],
+        )
+        self.cursor.executemany(
+            """
+            UPDATE OrderDetails
+            SET allocated_quantity = allocated_quantity + ?
+            WHERE order_id = ? AND product_id = ?
+            """,
+            [
+                (quantity, order_id, product_id)
+                for _, product_id, _, _, quantity, _, _ in schedule_rows
+            ],
+        )
+        self.cursor.execute(
+            """
+            UPDATE Orders
+            SET status = CASE
+                WHEN EXISTS (
+                    SELECT 1 FROM OrderDetails
+                    WHERE order_id = ? AND remaining_quantity > 0
+                ) THEN 'Partially Allocated'
+                ELSE 'Allocated'
+            END
+            WHERE order_id = ?
+            """,
+            (order_id, order_id),
+        )
+
+    def get_production_backlog(
+        self,
+        product_ids: list[str] = None,
+        status: str = "Backlogged",
+        product_id: str = None,
+    ) -> list[dict]:
         """
-        Retrieves backlogged production items, optionally filtered by product.
+        Retrieves backlogged production items, optionally filtered by products.
 
         Args:
-            product_id (str, optional): The ID of the product to filter by.
+            product_ids (list[str], optional): The IDs of the products to filter by.
+            status (str, optional): The schedule status to match. Defaults to 'Backlogged'.
+            product_id (str, optional): A single product ID to filter by, as
+                accepted before product_ids; added to product_ids if both are given.
 
         Returns:
             list[dict]: A list of backlogged production items.
@@ -712,32 +1090,48 @@ class Production:
         - name: Get Production Backlog
           function: production.get_production_backlog
           arguments:
-            product_id: "P001"
+            product_ids: ["P001", "P002"]
           output_var: backlog
         ```
         """
+        # Plans written for the single-product signature pass one ID string
+        if isinstance(product_ids, str):
+            product_ids = [product_ids]
+        if product_id is not None:
+            product_ids = [*(product_ids or []), product_id]
+        return list(self.iter_production_backlog(product_ids, status))
+
+    def iter_production_backlog(
+        self, product_ids: list[str] = None, status: str = "Backlogged"
+    ):
+        """
+        Streams backlogged production items, optionally filtered by products.
+
+        Rows are read from the cursor as they are consumed rather than being
+        materialized up front. A dedicated cursor is used so other API calls
+        can run while the iterator is being consumed.
+
+        Args:
+            product_ids (list[str], optional): The IDs of the products to filter by.
+            status (str, optional): The schedule status to match. Defaults to 'Backlogged'.
+
+        Yields:
+            dict: A backlogged production item, shaped as in get_production_backlog.
+        """
+        cursor = _streaming_cursor(self.cursor)
         query = """
-            SELECT schedule_id, product_id, start_date, end_date, available_capacity, status
+            SELECT schedule_id, product_id, start_date, end_date, available_capacity AS quantity, status
             FROM ProductionSchedule
-            WHERE status = 'Backlogged'
+            WHERE status = ?
         """
-        params = []
-        if product_id:
-            query += " AND product_id = ?"
-            params.append(product_id)
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "schedule_id": row[0],
-                "product_id": row[1],
-                "start_date": row[2],
-                "end_date": row[3],
-                "quantity": row[4],
-                "status": row[5],
-            }
-            for row in rows
-        ]
+        params = [status]
+        if product_ids:
+            placeholders = ", ".join("?" for _ in product_ids)
+            query += f" AND product_id IN ({placeholders})"
+            params.extend(product_ids)
+        cursor.execute(query, params)
+        for row in cursor:
+            yield dict(row)
 
     def allocate_prebooked_production(self, order_id: str) -> list[dict]:
         """
@@ -773,118 +1167,135 @@ class Production:
           output_var: allocation_result
         ```
         """
-        self.cursor.execute(
-            """
-            SELECT od.product_id, od.remaining_quantity
-            FROM OrderDetails od
-            WHERE od.order_id = ? AND od.remaining_quantity > 0
-            """,
-            (order_id,),
-        )
-        rows = self.cursor.fetchall()
-
-        allocation_result = []
-
-        for (
-            product_id,
-            remaining_quantity,
-        ) in rows:
+        with _transaction(self.cursor):
             self.cursor.execute(
                 """
-                SELECT schedule_id, available_capacity
-                FROM ProductionSchedule
-                WHERE product_id = ? AND available_capacity > 0 AND status = 'Scheduled'
-                ORDER BY start_date ASC
+                SELECT od.product_id, od.remaining_quantity
+                FROM OrderDetails od
+                WHERE od.order_id = ? AND od.remaining_quantity > 0
                 """,
-                (product_id,),
+                (order_id,),
             )
-            production_rows = self.cursor.fetchall()
-
-            for schedule_id, available_capacity in production_rows:
-                allocation = min(available_capacity, remaining_quantity)
-
-                # Allocate capacity
-                self.cursor.execute(
-                    """
-                    UPDATE ProductionSchedule
-                    SET allocated_capacity = allocated_capacity + ?
-                    WHERE schedule_id = ?
-                    """,
-                    (allocation, schedule_id),
-                )
-
-                # Create ProductionAllocation record
-                self.cursor.execute(
-                    """
-                    INSERT INTO ProductionAllocation (allocation_id, production_schedule_id, order_id, allocated_quantity)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        f"PA_{schedule_id}_{order_id}",
-                        schedule_id,
-                        order_id,
-                        allocation,
-                    ),
-                )
-
-                # Update OrderDetails
+            rows = self.cursor.fetchall()
+
+            allocation_result = []
+            schedule_updates = []
+            allocation_inserts = []
+            order_detail_updates = []
+
+            for (
+                product_id,
+                remaining_quantity,
+            ) in rows:
+                # Only fetch the schedules needed to cover the remaining
+                # quantity: those whose earlier capacity falls short of it
                 self.cursor.execute(
                     """
-                    UPDATE OrderDetails
-                    SET allocated_quantity = allocated_quantity + ?
-                    WHERE order_id = ? AND product_id = ?
+                    SELECT schedule_id, available_capacity
+                    FROM (
+                        SELECT schedule_id, available_capacity, start_date,
+                        SUM(available_capacity) OVER (
+                            ORDER BY start_date ASC, schedule_id ASC
+                        ) - available_capacity AS capacity_before
+                        FROM ProductionSchedule
+                        WHERE product_id = ? AND available_capacity > 0 AND status = 'Scheduled'
+                    )
+                    WHERE capacity_before < ?
+                    ORDER BY start_date ASC, schedule_id ASC
                     """,
-                    (allocation, order_id, product_id),
-                )
-
-                # Update remaining_quantity dynamically
-                remaining_quantity -= allocation
-
-                # Add allocation status for this product
-                allocation_result.append(
-                    {
-                        "product_id": product_id,
-                        "newly_allocated_quantity": allocation,
-                        "remaining_quantity": remaining_quantity,  # Include in output
-                    }
+                    (product_id, remaining_quantity),
                 )
+                production_rows = self.cursor.fetchall()
+
+                for schedule_id, available_capacity in production_rows:
+                    allocation = min(available_capacity, remaining_quantity)
+
+                    schedule_updates.append((allocation, schedule_id))
+                    allocation_inserts.append(
+                        (
+                            f"PA_{schedule_id}_{order_id}",
+                            schedule_id,
+                            order_id,
+                            allocation,
+                        )
+                    )
+                    order_detail_updates.append(
+                        (allocation, order_id, product_id)
+                    )
+
+                    # Update remaining_quantity dynamically
+                    remaining_quantity -= allocation
+
+                    # Add allocation status for this product
+                    allocation_result.append(
+                        {
+                            "product_id": product_id,
+                            "newly_allocated_quantity": allocation,
+                            "remaining_quantity": remaining_quantity,  # Include in output
+                        }
+                    )
+
+                    # Stop allocation if fully allocated
+                    if remaining_quantity <= 0:
+                        break
+
+            # Allocate capacity
+            self.cursor.executemany(
+                """
+                UPDATE ProductionSchedule
+                SET allocated_capacity = allocated_capacity + ?
+                WHERE schedule_id = ?
+                """,
+                schedule_updates,
+            )
 
-                # Stop allocation if fully allocated
-                if remaining_quantity <= 0:
-                    break
+            # Create ProductionAllocation records
+            self.cursor.executemany(
+                """
+                INSERT INTO ProductionAllocation (allocation_id, production_schedule_id, order_id, allocated_quantity)
+                VALUES (?, ?, ?, ?)
+                """,
+                allocation_inserts,
+            )
 
-        # Update order status if all items are fully allocated
-        self.cursor.execute(
-            """
-            SELECT COUNT(*) FROM OrderDetails
-            WHERE order_id = ? AND remaining_quantity > 0
-            """,
-            (order_id,),
-        )
-        unallocated_count = self.cursor.fetchone()[0]
+            # Update OrderDetails
+            self.cursor.executemany(
+                """
+                UPDATE OrderDetails
+                SET allocated_quantity = allocated_quantity + ?
+                WHERE order_id = ? AND product_id = ?
+                """,
+                order_detail_updates,
+            )
 
-        self.cursor.execute(
-            """
-            UPDATE Orders
-            SET status = ?
-            WHERE order_id = ?
-            """,
-            (
-                (
-                    "Allocated"
-                    if unallocated_count == 0
-                    else "Partially Allocated"
-                ),
-                order_id,
-            ),
-        )
+            # Update order status if all items are fully allocated
+            self.cursor.execute(
+                """
+                UPDATE Orders
+                SET status = CASE
+                    WHEN EXISTS (
+                        SELECT 1 FROM OrderDetails
+                        WHERE order_id = ? AND remaining_quantity > 0
+                    ) THEN 'Partially Allocated'
+                    ELSE 'Allocated'
+                END
+                WHERE order_id = ?
+                """,
+                (order_id, order_id),
+            )
 
-        return allocation_result
+            return allocation_result
 
 
-class Shipping:
+class Shipping(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
+        self._cached_shipping_options = lru_cache(maxsize=512)(
+            self._get_shipping_options_uncached
+        )
+
+    def _clear_cache(self):
+        self._cached_shipping_options.cache_clear()
 
     def get_shipping_options(self, order_id: str) -> list[dict]:
         """
@@ -922,26 +1333,22 @@ class Shipping:
           output_var: shipping_options
         ```
         """
+        return [
+            dict(option)
+            for option in self._cached_shipping_options(order_id)
+        ]
+
+    def _get_shipping_options_uncached(self, order_id):
         self.cursor.execute(
             """
-            SELECT so.destination, so.shipping_option_id, so.carrier_id, so.service_level, so.cost, so.estimated_days
+            SELECT so.shipping_option_id, so.carrier_id, so.service_level, so.cost, so.estimated_days
             FROM Orders o
             JOIN ShippingOptions so ON so.destination = o.customer_id
             WHERE o.order_id = ?
             """,
             (order_id,),
         )
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "shipping_option_id": row[1],
-                "carrier_id": row[2],
-                "service_level": row[3],
-                "cost": row[4],
-                "estimated_days": row[5],
-            }
-            for row in rows
-        ]
+        return [dict(row) for row in self.cursor.fetchall()]
 
     def confirm_shipment(self, order_id: str, shipping_option_id: str) -> dict:
         """
@@ -1032,18 +1439,14 @@ class Shipping:
         row = self.cursor.fetchone()
         if not row:
             return {"status": "Not Found"}
-        return {
-            "shipment_id": row[0],
-            "order_id": row[1],
-            "shipping_option_id": row[2],
-            "shipped_date": row[3],
-        }
+        return dict(row)
 
 
-class Component:
+class Component(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
 
+    @read_only_step
     def check_components_for_product(self, product_id: str) -> list[dict]:
         """
         Checks component stock for a given product
@@ -1077,22 +1480,14 @@ class Component:
         """
         self.cursor.execute(
             """
-            SELECT pc.component_id, pc.quantity_needed_per_unit, c.stock_quantity
+            SELECT pc.component_id, pc.quantity_needed_per_unit AS required_quantity, c.stock_quantity AS available_quantity
             FROM ProductComponents pc
             JOIN Components c ON pc.component_id = c.component_id
             WHERE pc.product_id = ?
             """,
             (product_id,),
         )
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "component_id": row[0],
-                "required_quantity": row[1],
-                "available_quantity": row[2],
-            }
-            for row in rows
-        ]
+        return [dict(row) for row in self.cursor.fetchall()]
 
     def reserve_stock_components(self, product_id: str, quantity: int) -> dict:
         """
@@ -1127,28 +1522,35 @@ class Component:
           output_var: reservation_result
         ```
         """
-        inventory = self.check_components_for_product(product_id)
-        reservation_result = []
-        for item in inventory:
-            required = item["required_quantity"] * quantity
-            available = item["available_quantity"]
-            reserved = min(required, available)
-            shortfall = required - reserved
-
-            # Update stock in the database
+        with _transaction(self.cursor):
             self.cursor.execute(
-                "UPDATE Components SET stock_quantity = stock_quantity - ? WHERE component_id = ?",
-                (reserved, item["component_id"]),
+                """
+                SELECT pc.component_id,
+                MIN(pc.quantity_needed_per_unit * ?, c.stock_quantity) AS reserved_quantity,
+                MAX(pc.quantity_needed_per_unit * ? - c.stock_quantity, 0) AS shortfall
+                FROM ProductComponents pc
+                JOIN Components c ON pc.component_id = c.component_id
+                WHERE pc.product_id = ?
+                """,
+                (quantity, quantity, product_id),
             )
-            reservation_result.append(
-                {
-                    "component_id": item["component_id"],
-                    "reserved_quantity": reserved,
-                    "shortfall": shortfall if shortfall > 0 else 0,
-                }
+            reservation_result = [
+                dict(row) for row in self.cursor.fetchall()
+            ]
+
+            # Reserve every component of the product in one statement
+            self.cursor.execute(
+                """
+                UPDATE Components
+                SET stock_quantity = stock_quantity - MIN(pc.quantity_needed_per_unit * ?, Components.stock_quantity)
+                FROM ProductComponents pc
+                WHERE pc.product_id = ? AND pc.component_id = Components.component_id
+                """,
+                (quantity, product_id),
             )
-        return reservation_result
+            return reservation_result
 
+    @read_only_step
     def check_component_availability(self, component_id: str) -> int:
         """
         Checks the stock level of a specific component.
@@ -1168,13 +1570,48 @@ class Component:
           output_var: component_stock
         ```
         """
-        self.cursor.execute(
-            "SELECT stock_quantity FROM Components WHERE component_id = ?",
+        result = self.cursor.execute(
+            "SELECT stock_quantity FROM Components WHERE component_id = ? LIMIT 1",
             (component_id,),
-        )
-        result = self.cursor.fetchone()
+        ).fetchone()
         return result[0] if result else 0
 
+    @read_only_step
+    def check_components_availability(self, component_ids: list[str]) -> dict:
+        """
+        Checks the stock levels of several components in one lookup.
+        Prefer this to looping over check_component_availability.
+
+        Args:
+            component_ids (list[str]): The IDs of the components to check.
+
+        Returns:
+            dict: The available stock keyed by component ID (0 if unknown).
+            Example:
+            {
+                "C001": 150,
+                "C002": 250,
+            }
+
+        DSL Example:
+        ```
+        - name: Check Components Availability
+          function: component.check_components_availability
+          arguments:
+            component_ids: ["C001", "C002"]
+          output_var: component_stock_levels
+        ```
+        """
+        placeholders = ", ".join("?" for _ in component_ids)
+        self.cursor.execute(
+            f"SELECT component_id, stock_quantity FROM Components WHERE component_id IN ({placeholders})",
+            component_ids,
+        )
+        stock_levels = dict.fromkeys(component_ids, 0)
+        stock_levels.update(self.cursor.fetchall())
+        return stock_levels
+
+    @read_only_step
     def check_supplier_components(self, supplier_id: str) -> list[dict]:
         """
         Retrieves the list of components available from a specific supplier.
@@ -1214,21 +1651,14 @@ class Component:
             """,
             (supplier_id,),
         )
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "component_id": row[0],
-                "available_quantity": row[1],
-                "cost_per_unit": row[2],
-            }
-            for row in rows
-        ]
+        return [dict(row) for row in self.cursor.fetchall()]
 
     def place_component_order(
         self, supplier_id: str, component_id: str, quantity: int
     ) -> dict:
         """
-        Places an order for components from a supplier.
+        Places an order for components from a supplier, drawing down the
+        supplier's available quantity.
 
         Args:
             supplier_id (str): The ID of the supplier.
@@ -1256,22 +1686,79 @@ class Component:
           output_var: order_confirmation
         ```
         """
-        self.cursor.execute(
+        return self._place_component_order(
+            supplier_id, component_id, quantity
+        )
+
+    def place_component_orders(self, orders: list[dict]) -> list[dict]:
+        """
+        Places several component orders at once, in a single transaction.
+
+        Args:
+            orders (list[dict]): The orders to place, each with a supplier_id,
+                component_id and quantity as accepted by place_component_order.
+
+        Returns:
+            list[dict]: One confirmation per order, in input order, shaped as
+            in place_component_order.
+
+        DSL Example:
+        ```
+        - name: Place Component Orders
+          function: component.place_component_orders
+          arguments:
+            orders:
+              - supplier_id: "S001"
+                component_id: "C001"
+                quantity: 100
+              - supplier_id: "S002"
+                component_id: "C002"
+                quantity: 50
+          output_var: order_confirmations
+        ```
+        """
+        # executemany discards RETURNING rows, so each order runs the same
+        # cached statement and the transaction pays a single commit
+        with _transaction(self.cursor):
+            return [
+                self._place_component_order(
+                    order["supplier_id"],
+                    order["component_id"],
+                    order["quantity"],
+                )
+                for order in orders
+            ]
+
+    def _place_component_order(self, supplier_id, component_id, quantity):
+        """
+        Places one component order; shared by the single and batched steps.
+
+        Args:
+            supplier_id (str): The ID of the supplier.
+            component_id (str): The ID of the component.
+            quantity (int): The quantity to order.
+
+        Returns:
+            dict: The confirmation, shaped as in place_component_order.
+        """
+        # Check and take the supplier's stock in one statement, so two
+        # concurrent orders can't both pass the availability check
+        result = self.cursor.execute(
             """
-            SELECT available_quantity, cost_per_unit
-            FROM SupplierComponents
-            WHERE supplier_id = ? AND component_id = ?
+            UPDATE SupplierComponents
+            SET available_quantity = available_quantity - ?
+            WHERE supplier_id = ? AND component_id = ? AND available_quantity >= ?
+            RETURNING cost_per_unit
             """,
-            (supplier_id, component_id),
-        )
-        result = self.cursor.fetchone()
-        if not result or result[0] < quantity:
+            (quantity, supplier_id, component_id, quantity),
+        ).fetchone()
+        if not result:
             return {
                 "status": "Failed",
                 "reason": "Insufficient stock from supplier",
             }
 
-        cost = quantity * result[1]
+        cost = quantity * result[0]
         return {
             "status": "Success",
             "supplier_id": supplier_id,
@@ -1281,19 +1768,24 @@ class Component:
         }
 
 
-class Report:
+class Report(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
 
-    def generate_replenishment_report(self, threshold: int) -> list[dict]:
+    def generate_replenishment_report(
+        self, threshold: int, columnar: bool = False
+    ) -> list[dict] | dict:
         """
         Generates a report of components with stock below a specified threshold.
 
         Args:
             threshold (int): The stock level threshold.
+            columnar (bool, optional): Return one list per column instead of a
+                dict per row, which is lighter for large reports. Defaults to False.
 
         Returns:
-            list[dict]:
+            list[dict] | dict: The report rows, or column name to column values
+            when columnar is set.
             Example:
             [
                 {
@@ -1316,32 +1808,41 @@ class Report:
           output_var: replenishment_report
         ```
         """
-        self.cursor.execute(
-            "SELECT component_id, name, stock_quantity FROM Components WHERE stock_quantity < ?",
-            (threshold,),
-        )
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "component_id": row[0],
-                "name": row[1],
-                "stock_quantity": row[2],
-            }
-            for row in rows
-        ]
+        if columnar:
+            self.cursor.execute(_REPLENISHMENT_REPORT_QUERY, (threshold,))
+            return _fetch_columns(self.cursor)
+        return list(self.iter_replenishment_report(threshold))
+
+    def iter_replenishment_report(self, threshold: int):
+        """
+        Streams the replenishment report without buffering the whole result.
+
+        Args:
+            threshold (int): The stock level threshold.
+
+        Yields:
+            dict: A component row, shaped as in generate_replenishment_report.
+        """
+        cursor = _streaming_cursor(self.cursor)
+        cursor.execute(_REPLENISHMENT_REPORT_QUERY, (threshold,))
+        for row in cursor:
+            yield dict(row)
 
     def generate_production_report(
-        self, start_date: str, end_date: str
-    ) -> list[dict]:
+        self, start_date: str, end_date: str, columnar: bool = False
+    ) -> list[dict] | dict:
         """
         Generates a report of production schedules within a specific date range.
 
         Args:
             start_date (str): Start date of the report (inclusive).
             end_date (str): End date of the report (inclusive).
+            columnar (bool, optional): Return one list per column instead of a
+                dict per row. Defaults to False.
 
         Returns:
-            list[dict]:
+            list[dict] | dict: The report rows, or column name to column values
+            when columnar is set.
             Example:
             [
                 {
@@ -1371,39 +1872,47 @@ class Report:
           output_var: production_report
         ```
         """
-        self.cursor.execute(
-            """
-            SELECT schedule_id, product_id, start_date, end_date, total_capacity, status
-            FROM ProductionSchedule
-            WHERE start_date >= ? AND end_date <= ?
-            """,
-            (start_date, end_date),
-        )
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "schedule_id": row[0],
-                "product_id": row[1],
-                "start_date": row[2],
-                "end_date": row[3],
-                "quantity": row[4],
-                "status": row[5],
-            }
-            for row in rows
-        ]
+        if columnar:
+            self.cursor.execute(
+                _PRODUCTION_REPORT_QUERY, (start_date, end_date)
+            )
+            return _fetch_columns(self.cursor)
+        return list(self.iter_production_report(start_date, end_date))
+
+    def iter_production_report(self, start_date: str, end_date: str):
+        """
+        Streams the production report without buffering the whole result.
+
+        Args:
+            start_date (str): Start date of the report (inclusive).
+            end_date (str): End date of the report (inclusive).
+
+        Yields:
+            dict: A schedule row, shaped as in generate_production_report.
+        """
+        cursor = _streaming_cursor(self.cursor)
+        cursor.execute(_PRODUCTION_REPORT_QUERY, (start_date, end_date))
+        for row in cursor:
+            yield dict(row)
 
     def generate_order_report(
-        self, status: str = None, customer_id: str = None
-    ) -> list[dict]:
+        self,
+        status: str = None,
+        customer_id: str = None,
+        columnar: bool = False,
+    ) -> list[dict] | dict:
         """
         Generates a report of orders filtered by status or customer.
 
         Args:
             status (str, optional): The status of the orders to filter by (e.g., 'Pending').
             customer_id (str, optional): The customer ID to filter orders for.
+            columnar (bool, optional): Return one list per column instead of a
+                dict per row. Defaults to False.
 
         Returns:
-            list[dict]:
+            list[dict] | dict: The report rows, or column name to column values
+            when columnar is set.
             Example:
             [
                 {
@@ -1428,25 +1937,30 @@ class Report:
           output_var: order_report
         ```
         """
-        query = "SELECT order_id, customer_id, order_date, status FROM Orders WHERE 1=1"
-        params = []
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if customer_id:
-            query += " AND customer_id = ?"
-            params.append(customer_id)
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "order_id": row[0],
-                "customer_id": row[1],
-                "order_date": row[2],
-                "status": row[3],
-            }
-            for row in rows
-        ]
+        if columnar:
+            query = _ORDER_REPORT_QUERIES[(bool(status), bool(customer_id))]
+            params = [value for value in (status, customer_id) if value]
+            self.cursor.execute(query, params)
+            return _fetch_columns(self.cursor)
+        return list(self.iter_order_report(status, customer_id))
+
+    def iter_order_report(self, status: str = None, customer_id: str = None):
+        """
+        Streams the order report without buffering the whole result.
+
+        Args:
+            status (str, optional): The status of the orders to filter by.
+            customer_id (str, optional): The customer ID to filter orders for.
+
+        Yields:
+            dict: An order row, shaped as in generate_order_report.
+        """
+        query = _ORDER_REPORT_QUERIES[(bool(status), bool(customer_id))]
+        params = [value for value in (status, customer_id) if value]
+        cursor = _streaming_cursor(self.cursor)
+        cursor.execute(query, params)
+        for row in cursor:
+            yield dict(row)
 
     def generate_summary_report(self) -> dict:
         """
@@ -1508,49 +2022,60 @@ class Report:
           output_var: summary_report
         ```
         """
-        self.cursor.execute("SELECT product_id, stock_quantity FROM Inventory")
-        inventory = [
-            {"product_id": row[0], "stock_quantity": row[1]}
-            for row in self.cursor.fetchall()
-        ]
-
+        # Fetch all three sections in one round trip, tagging each row with
+        # the section it belongs to
         self.cursor.execute(
             """
-            SELECT order_id, customer_id, order_date, status
+            SELECT 'inventory', product_id, stock_quantity, NULL, NULL, NULL, NULL
+            FROM Inventory
+            UNION ALL
+            SELECT 'pending_orders', order_id, customer_id, order_date, status, NULL, NULL
             FROM Orders
             WHERE status = 'Pending'
-            """
-        )
-        pending_orders = [
-            {
-                "order_id": row[0],
-                "customer_id": row[1],
-                "order_date": row[2],
-                "status": row[3],
-            }
-            for row in self.cursor.fetchall()
-        ]
-
-        self.cursor.execute(
-            """
-            SELECT schedule_id, product_id, start_date, end_date, total_capacity, status
+            UNION ALL
+            SELECT 'production_schedule', schedule_id, product_id, start_date, end_date, total_capacity, status
             FROM ProductionSchedule
             """
         )
-        production_schedule = [
-            {
-                "schedule_id": row[0],
-                "product_id": row[1],
-                "start_date": row[2],
-                "end_date": row[3],
-                "quantity": row[4],
-                "status": row[5],
-            }
-            for row in self.cursor.fetchall()
-        ]
-
-        return {
-            "inventory": inventory,
-            "pending_orders": pending_orders,
-            "production_schedule": production_schedule,
+        summary = {
+            "inventory": [],
+            "pending_orders": [],
+            "production_schedule": [],
         }
+        for tag, *values in self.cursor.fetchall():
+            if tag == "inventory":
+                product_id, stock_quantity = values[:2]
+                summary[tag].append(
+                    {"product_id": product_id, "stock_quantity": stock_quantity}
+                )
+            elif tag == "pending_orders":
+                order_id, customer_id, order_date, status = values[:4]
+                summary[tag].append(
+                    {
+                        "order_id": order_id,
+                        "customer_id": customer_id,
+                        "order_date": order_date,
+                        "status": status,
+                    }
+                )
+            else:
+                (
+                    schedule_id,
+                    product_id,
+                    start_date,
+                    end_date,
+                    quantity,
+                    status,
+                ) = values
+                summary[tag].append(
+                    {
+                        "schedule_id": schedule_id,
+                        "product_id": product_id,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "quantity": quantity,
+                        "status": status,
+                    }
+                )
+
+        return summary
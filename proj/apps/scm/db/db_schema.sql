@@ -143,6 +143,15 @@ CREATE TABLE TaskLogs (
     details TEXT
 );
 
+-- Indexes for the SCM API's hot lookups. Inventory, OrderDetails(order_id)
+-- and ProductComponents(product_id) are already covered by their primary keys.
+CREATE INDEX idx_orders_status_customer ON Orders(status, customer_id);
+CREATE INDEX idx_production_schedule_product_status_start ON ProductionSchedule(product_id, status, start_date);
+CREATE INDEX idx_shipments_tracking_number ON Shipments(tracking_number);
+-- Report filters: the replenishment index also covers the selected columns.
+CREATE INDEX idx_components_stock ON Components(stock_quantity, component_id, name);
+CREATE INDEX idx_production_schedule_dates ON ProductionSchedule(start_date, end_date);
+
 -- Sample Data: Products
 INSERT INTO Products (product_id, name, price, description) VALUES
 ('P001', 'Smart Home Hub', 150.99, 'A central hub for smart home devices'),
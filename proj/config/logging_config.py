@@ -1,22 +1,42 @@
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Set once logging is configured; every module calls setup_logging on import
+_CONFIGURED = False
 
 
 # Function to set up logging
 def setup_logging(log_dir="../../logs", log_file="workflow.log"):
+    global _CONFIGURED
+    if _CONFIGURED:
+        # A second FileHandler would truncate the log and leak a file handle
+        return
+    _CONFIGURED = True
+
     # Ensure the logs directory exists
     os.makedirs(log_dir, exist_ok=True)
 
     log_path = os.path.join(log_dir, log_file)
 
+    file_handler = logging.FileHandler(
+        log_path, mode="w"
+    )  # Overwrite log file on each run
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
     logging.basicConfig(
         level=logging.DEBUG,
-        format="%(asctime)s - %(levelname)s - %(message)s",
+        format=LOG_FORMAT,
         handlers=[
-            logging.FileHandler(
-                log_path, mode="w"
-            ),  # Overwrite log file on each run
+            # Buffer file records and write them in batches, flushing
+            # straight away on errors and when logging shuts down
+            MemoryHandler(
+                capacity=10000,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+            ),
             logging.StreamHandler(),  # Keep console logging
         ],
     )
@@ -1,31 +1,389 @@
+import ast
+import datetime
+import operator
 import sqlite3
 import yaml
 import importlib
 import inspect
 import logging
-import traceback
 import re
+from collections import ChainMap, namedtuple
+from functools import lru_cache
 
 from proj.config.logging_config import setup_logging
+from proj.dsl.dsl_namespace import DSLNamespace
+from proj.utils.db_helpers import tune_connection
 from proj.utils.path_helpers import get_db_file
 
 setup_logging()
+logger = logging.getLogger(__name__)
+
+# A `{...}` placeholder inside a step argument or condition
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^\}]+)\}")
+
+# A loop source that is a single placeholder, e.g. "{pending_orders}"
+_WHOLE_PLACEHOLDER_PATTERN = re.compile(r"\{([^{}]+)\}")
+
+
+# libyaml's loader when PyYAML was built with it, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression):
+    """
+    Compiles a DSL expression for eval, reusing earlier compilations.
+
+    The cache is bounded since conditions are compiled after their
+    placeholders are rendered, so their text can vary with the data.
+
+    Args:
+        expression (str): The Python expression to compile.
+
+    Returns:
+        CodeType: The compiled code object.
+    """
+    return compile(expression, "<dsl>", "eval")
+
+
+@lru_cache(maxsize=1024)
+def _compile_lookup(expression):
+    """
+    Compiles a pure lookup expression into a getter chain.
+
+    Covers a variable name followed by constant subscripts and attribute
+    access, e.g. `pending_orders[0]['order_id']`. These are the bulk of
+    placeholders, and a getter chain skips eval's frame setup and evaluates
+    nothing but lookups.
+
+    Args:
+        expression (str): The placeholder expression.
+
+    Returns:
+        tuple | None: (variable name, getters to apply in order), or None
+            when the expression is anything other than a lookup.
+    """
+    try:
+        node = ast.parse(expression, mode="eval").body
+    except SyntaxError:
+        return None
+    getters = []
+    while True:
+        if isinstance(node, ast.Subscript) and isinstance(
+            node.slice, ast.Constant
+        ):
+            getters.append(operator.itemgetter(node.slice.value))
+        elif isinstance(node, ast.Attribute):
+            getters.append(operator.attrgetter(node.attr))
+        elif isinstance(node, ast.Name):
+            return node.id, tuple(reversed(getters))
+        else:
+            return None
+        node = node.value
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(text):
+    """
+    Compiles a string with several placeholders into one evaluation.
+
+    All of the string's expressions go into a single tuple expression, so
+    they cost one eval between them, and the literal text becomes a
+    %-format string to render the values into.
+
+    Args:
+        text (str): The string holding the placeholders.
+
+    Returns:
+        tuple | None: (format string, code object), or None for fewer than
+            two placeholders or expressions that don't compile together.
+    """
+    parts = _PLACEHOLDER_PATTERN.split(text)
+    literals, expressions = parts[::2], parts[1::2]
+    if len(expressions) < 2:
+        return None
+    try:
+        code = compile(f"({', '.join(expressions)},)", "<dsl>", "eval")
+    except SyntaxError:
+        return None
+    template = "%s".join(literal.replace("%", "%%") for literal in literals)
+    return template, code
+
+
+# Parsed step kinds; _execute_step dispatches on the type
+LoopStep = namedtuple("LoopStep", "variable over steps")
+ConditionStep = namedtuple("ConditionStep", "condition steps")
+CallStep = namedtuple(
+    "CallStep", "name function arguments output_var placeholder_paths"
+)
+
+
+@lru_cache(maxsize=128)
+def parse_task(task_yaml):
+    """
+    Parses a DSL task, reusing the result for a task that was seen before.
+
+    The cached tree is shared between runs. Its argument dicts and lists
+    are never handed to a step function directly; each call gets its own
+    copy, so a callee that changes its arguments can't change the task.
+
+    Args:
+        task_yaml (str): The task definition in YAML.
+
+    Returns:
+        tuple: The task's compiled steps.
+    """
+    task = yaml.load(task_yaml, Loader=_YAML_LOADER)
+    return _compile_steps(task.get("steps", []))
+
+
+def _compile_steps(steps):
+    """
+    Converts parsed YAML steps into LoopStep, ConditionStep and CallStep.
+
+    Args:
+        steps (list): Step definitions as loaded from the task YAML.
+
+    Returns:
+        tuple: The compiled steps, nested steps included.
+    """
+    compiled = []
+    for step in steps:
+        loop = step.get("loop")
+        if loop:
+            compiled.append(
+                LoopStep(
+                    loop.get("variable"),
+                    loop.get("over"),
+                    _compile_steps(step.get("steps", [])),
+                )
+            )
+        elif step.get("condition"):
+            compiled.append(
+                ConditionStep(
+                    step["condition"], _compile_steps(step.get("steps", []))
+                )
+            )
+        else:
+            arguments = step.get("arguments", {})
+            compiled.append(
+                CallStep(
+                    step.get("name", "Unnamed Step"),
+                    step.get("function"),
+                    arguments,
+                    step.get("output_var"),
+                    _placeholder_paths(arguments),
+                )
+            )
+    return tuple(compiled)
+
+
+def _placeholder_paths(arguments):
+    """
+    Finds the argument leaves that contain placeholders.
+
+    Only these leaves need resolving on each call; everything else is passed
+    through as parsed.
+
+    Args:
+        arguments (Any): A step's arguments as loaded from the task YAML.
+
+    Returns:
+        tuple | None: A (key/index path, text) pair per string holding a
+            placeholder, or None when the arguments aren't a mapping and must
+            be resolved whole.
+    """
+    if not isinstance(arguments, dict):
+        return None
+    paths = []
+
+    def walk(value, path):
+        if isinstance(value, str):
+            if "{" in value and "}" in value:
+                paths.append((path, value))
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                walk(item, path + (index,))
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                walk(item, path + (key,))
+
+    walk(arguments, ())
+    return tuple(paths)
+
+
+def _copy_containers(value):
+    """
+    Copies the dicts and lists of a plain data structure, e.g. a step result
+    made of row dicts, leaving the scalars in them shared.
+
+    Args:
+        value (Any): The structure to copy.
+
+    Returns:
+        Any: A copy that can be changed without affecting the original.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
+def _fill_paths(arguments, placeholder_paths, resolve):
+    """
+    Writes resolved values into a copy of the arguments.
+
+    The whole argument structure is copied, not just the containers on
+    placeholder paths, so nothing the step function receives is shared with
+    the parsed step.
+
+    Args:
+        arguments (dict): A step's arguments as parsed.
+        placeholder_paths (tuple): (path, text) pairs from _placeholder_paths.
+        resolve (Callable): Resolves a placeholder text to its value.
+
+    Returns:
+        dict: The arguments with every placeholder leaf replaced.
+    """
+    filled = _copy_containers(arguments)
+    for path, text in placeholder_paths:
+        parent = filled
+        for key in path[:-1]:
+            parent = parent[key]
+        parent[path[-1]] = resolve(text)
+    return filled
+
+
+# Step layouts found by _scan_steps, keyed by (source, API class)
+_STEP_LAYOUTS = {}
+
+
+def _scan_steps(instance):
+    """
+    Finds the step methods exposed by an API instance's namespaces.
+
+    Args:
+        instance (object): The top-level API instance, e.g. CORE or SCMAPI.
+
+    Returns:
+        list[tuple]: (registry key, attribute name, function) per step.
+    """
+    layout = []
+    for attr_name, attr in vars(instance).items():
+        if not isinstance(attr, DSLNamespace):
+            continue
+        for method_name, method in vars(type(attr)).items():
+            # if the method is a private method, an init method, not a
+            # function or a generator (step outputs must be materialized),
+            # skip it
+            if (
+                method_name.startswith("_")
+                or method_name == "init"
+                or not inspect.isfunction(method)
+                or inspect.isgeneratorfunction(method)
+            ):
+                continue
+            key = f"{attr_name.lower()}.{method_name}"
+            layout.append((key, attr_name, method))
+    return sorted(layout, key=lambda step: step[0])
 
 
 class DSLExecutor:
-    def __init__(self, app_name):
+    def __init__(self, app_name, db_path=None):
         self.app_name = app_name
-        db_path = get_db_file(app_name)
-        self.conn = sqlite3.connect(db_path)
+        # Defaults to the app's database; tests can point at their own copy
+        db_path = db_path or get_db_file(app_name)
+        # Headroom in the statement cache for the app's queries plus the
+        # per-length IN (...) variants, so hot statements stay prepared
+        self.conn = sqlite3.connect(db_path, cached_statements=256)
+        tune_connection(self.conn)
+        # Core and app steps alike get rows that map onto result dicts
+        self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
         self.dsl_context = {}
+        # Results of read-only steps in the current task, keyed by call
+        self._read_cache = {}
+        # Safe evaluation environment for placeholders and conditions
+        self._safe_globals = {
+            "datetime": datetime.datetime,
+            "timedelta": datetime.timedelta,
+            "abs": abs,  # Add built-in functions as needed
+        }
+        self.step_registry = self._register_steps(self.app_name)
+
+    def close(self):
+        """
+        Closes the executor's database connection.
+
+        PRAGMA optimize runs first so SQLite can refresh the query planner
+        statistics gathered during this session.
+
+        Returns:
+            None
+        """
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
+    def reset_steps(self):
+        """
+        Rebinds the steps to fresh API instances.
+
+        The API objects cache some results (e.g. shipping options, the next
+        order number). Call this after the database was changed or replaced
+        outside the executor, so none of those caches outlive their rows.
+
+        Returns:
+            None
+        """
+        self._read_cache.clear()
         self.step_registry = self._register_steps(self.app_name)
 
     def execute_task(self, task_yaml):
-        task = yaml.safe_load(task_yaml)
-        steps = task.get("steps", [])
-        for step in steps:
-            self._execute_step(step)
+        """
+        Executes a DSL task.
+
+        Args:
+            task_yaml (str | dict): The task as YAML, or a task that was
+                already loaded into a dict, which is then not parsed again.
+
+        Returns:
+            None
+        """
+        if isinstance(task_yaml, dict):
+            steps = _compile_steps(task_yaml.get("steps", []))
+        else:
+            steps = parse_task(task_yaml)
+        self.execute_parsed_task(steps)
+
+    def execute_parsed_task(self, steps):
+        """
+        Executes a task that was already parsed with parse_task.
+
+        If the caller already has a transaction open, the task runs inside it
+        and committing or rolling back is left to the caller.
+
+        Args:
+            steps (tuple): The compiled steps returned by parse_task.
+
+        Returns:
+            None
+        """
+        # Run the whole task as one transaction so its writes share a single
+        # commit; API methods that manage their own transaction join it
+        started = not self.conn.in_transaction
+        if started:
+            self.cursor.execute("BEGIN IMMEDIATE")
+        self._read_cache.clear()
+        try:
+            for step in steps:
+                self._execute_step(step)
+        except BaseException:
+            if started:
+                self.conn.rollback()
+            raise
+        if started:
+            self.conn.commit()
 
     def _execute_loop(self, loop_variable, loop_over, steps):
         """
@@ -39,28 +397,43 @@ class DSLExecutor:
         Returns:
             None
         """
-        # Resolve placeholders in `loop_over`
-        resolved_loop_over = self._resolve_placeholders(loop_over)
-
+        resolved_loop_over = loop_over
         try:
-            # Ensure the resolved `loop_over` is iterable
-            resolved_iterable = eval(resolved_loop_over, {}, self.dsl_context)
+            whole_placeholder = _WHOLE_PLACEHOLDER_PATTERN.fullmatch(loop_over)
+            if whole_placeholder:
+                # Evaluate the expression itself, rather than rendering the
+                # iterable to a string and parsing it back
+                resolved_iterable = eval(
+                    _compile_expression(whole_placeholder.group(1)),
+                    self._safe_globals,
+                    self.dsl_context,
+                )
+            else:
+                # Resolve placeholders in `loop_over`
+                resolved_loop_over = self._resolve_placeholders(loop_over)
+                resolved_iterable = eval(
+                    resolved_loop_over, {}, self.dsl_context
+                )
 
+            # Ensure the resolved `loop_over` is iterable
             if not isinstance(resolved_iterable, (list, range)):
                 raise ValueError(
                     f"Resolved value is not iterable: {resolved_iterable}"
                 )
 
             for item in resolved_iterable:
-                # Create a combined context with the loop variable
-                loop_context = {**self.dsl_context, loop_variable: item}
-                logging.info(f"Loop iteration with {loop_variable} = {item}")
+                # Layer the loop variable over the DSL context (no copy, so
+                # outputs of earlier steps in this iteration stay visible)
+                loop_context = ChainMap(
+                    {loop_variable: item}, self.dsl_context
+                )
+                logger.info("Loop iteration with %s = %s", loop_variable, item)
 
                 for step in steps:
                     # Pass the updated context with the loop variable to each nested step
                     self._execute_step(step, additional_context=loop_context)
         except Exception as e:
-            logging.error(
+            logger.error(
                 f"Loop variable '{loop_variable}' cannot iterate over unresolved or invalid value: {resolved_loop_over}. Error: {e}"
             )
 
@@ -77,25 +450,26 @@ class DSLExecutor:
             None
         """
         # Merge global context and additional context
-        context = {**self.dsl_context, **(additional_context or {})}
+        context = self._merged_context(additional_context)
 
         resolved_condition = self._resolve_condition(condition, context)
 
         if (
             resolved_condition
         ):  # Only execute steps if the condition resolves to True
-            logging.info(f"Condition '{condition}' evaluated to True.")
+            logger.info("Condition '%s' evaluated to True.", condition)
             for step in steps:
                 self._execute_step(step, additional_context=context)
         else:
-            logging.info(f"Condition '{condition}' evaluated to False.")
+            logger.info("Condition '%s' evaluated to False.", condition)
 
     def _execute_step(self, step, additional_context=None):
         """
         Executes a single DSL step.
 
         Args:
-            step (dict): The step definition containing:
+            step (LoopStep | ConditionStep | CallStep): The compiled step. A
+                CallStep holds:
                 - name: The name of the step.
                 - function: The function to execute (e.g., 'product.get_products').
                 - arguments: A dictionary of arguments to pass to the function.
@@ -106,61 +480,100 @@ class DSLExecutor:
             None
         """
 
+        step_type = type(step)
+
         # Check for loop
-        loop = step.get("loop")
-        if loop:
-            loop_variable = loop.get("variable")
-            loop_over = loop.get("over")
-            nested_steps = step.get("steps", [])
-            self._execute_loop(loop_variable, loop_over, nested_steps)
+        if step_type is LoopStep:
+            self._execute_loop(step.variable, step.over, step.steps)
             return
 
-        # Extract the condition if present
-        condition = step.get("condition")
-        if condition:
-            nested_steps = step.get("steps", [])
+        # Check for condition
+        if step_type is ConditionStep:
             condition_resolved = self._resolve_arguments(
-                condition, additional_context=additional_context
+                step.condition, additional_context=additional_context
             )
             self._execute_condition(
                 condition_resolved,
-                nested_steps,
+                step.steps,
                 additional_context=additional_context,
             )
             return
 
-        step_name = step.get("name", "Unnamed Step")
-        func_name = step.get("function")
-        args = step.get("arguments", {})
-        output_var = step.get("output_var")
+        step_name, func_name, args, output_var, placeholder_paths = step
 
-        logging.info(f"Executing Step: {step_name}")
-        logging.debug(f"Step Details: {step}")
-        logging.debug(f"Current Context: {self.dsl_context}")
+        logger.info("Executing Step: %s", step_name)
+        # The context can hold whole reports, so only render it when needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Step Details: %r", step)
+            logger.debug("Current Context: %r", self.dsl_context)
 
         # Retrieve the function metadata from the registry
         func_metadata = self.step_registry.get(func_name)
         if not func_metadata:
-            logging.error(f"Function '{func_name}' not implemented.")
+            logger.error(f"Function '{func_name}' not implemented.")
             return
 
         func = func_metadata["function"]  # Extract the actual function
 
-        # Resolve arguments with additional context
-        resolved_args = self._resolve_arguments(args, additional_context)
+        # Resolve arguments with additional context; literal arguments are
+        # only copied, so the step can't change the cached parsed task
+        if placeholder_paths is None:
+            resolved_args = self._resolve_arguments(args, additional_context)
+        elif placeholder_paths:
+            context = self._merged_context(additional_context)
+            resolved_args = _fill_paths(
+                args,
+                placeholder_paths,
+                lambda text: self._resolve_placeholders(text, context),
+            )
+        else:
+            resolved_args = _copy_containers(args)
 
-        try:
-            # Call the function
-            result = func(**resolved_args)
-        except Exception as e:
-            logging.error(f"Error executing function '{func_name}': {e}")
-            return
+        read_only = getattr(func, "dsl_read_only", False)
+        cache_key = None
+        if read_only:
+            try:
+                cache_key = (func_name, frozenset(resolved_args.items()))
+            except TypeError:
+                pass  # Unhashable arguments, call the step every time
+        else:
+            # Any other step may write, so earlier reads can't be reused
+            self._read_cache.clear()
+
+        if cache_key in self._read_cache:
+            # Each consumer gets its own copy, so one changing its result
+            # can't change what the others see
+            result = _copy_containers(self._read_cache[cache_key])
+        else:
+            # A failing step is logged and skipped while the task carries on,
+            # so whatever it wrote before failing is undone first
+            savepoint = not read_only and self.conn.in_transaction
+            if savepoint:
+                self.conn.execute("SAVEPOINT dsl_step")
+            try:
+                # Call the function
+                result = func(**resolved_args)
+            except Exception as e:
+                if savepoint:
+                    self.conn.execute("ROLLBACK TO dsl_step")
+                    self.conn.execute("RELEASE dsl_step")
+                logger.error(f"Error executing function '{func_name}': {e}")
+                return
+            if savepoint:
+                self.conn.execute("RELEASE dsl_step")
+            if cache_key is not None:
+                self._read_cache[cache_key] = _copy_containers(result)
 
         # Store the result in the DSL context if output_var is provided
         if output_var:
             self.dsl_context[output_var] = result
-            logging.info(
-                f"Step '{step_name}' completed. Output: {output_var} = {result}"
+            # Passed as arguments so a large result is only rendered when the
+            # record is actually emitted
+            logger.info(
+                "Step '%s' completed. Output: %s = %s",
+                step_name,
+                output_var,
+                result,
             )
 
     def _register_steps(self, app_name):
@@ -200,28 +613,11 @@ class DSLExecutor:
 
         try:
             core_instance = CORE(cursor=self.cursor)  # Initialize CORE class
-            for attr_name in dir(core_instance):
-                attr = getattr(core_instance, attr_name)
-                if inspect.isclass(
-                    type(attr)
-                ):  # Check if it's a nested class (e.g., `Message`)
-                    methods = inspect.getmembers(
-                        attr, predicate=inspect.ismethod
-                    )
-                    for method_name, method in methods:
-                        # if the method is a private method or an init method, skip it
-                        if (
-                            method_name.startswith("_")
-                            or method_name == "init"
-                        ):
-                            continue
-
-                        key = f"{attr_name.lower()}.{method_name}"
-                        registry[key] = {"function": method, "source": "core"}
-                        logging.info(f"Registered core function: {key}")
+            for key, method in self._bind_steps(("core", CORE), core_instance):
+                registry[key] = {"function": method, "source": "core"}
         except ImportError as e:
-            logging.error("Core steps class 'CORE' not found.")
-            logging.debug(traceback.format_exc())
+            logger.error("Core steps class 'CORE' not found.")
+            logger.debug("Import failure details", exc_info=True)
 
     def _register_app_steps(self, app_name, registry):
         """
@@ -236,21 +632,13 @@ class DSLExecutor:
         """
         try:
             app_module = importlib.import_module(f"proj.apps.{app_name}.api")
-            api_classes = inspect.getmembers(app_module, inspect.isclass)
 
             # Identify the top-level API class by naming convention
             top_level_class_name = f"{app_name.upper()}API"
-            top_level_class = next(
-                (
-                    cls
-                    for cls_name, cls in api_classes
-                    if cls_name == top_level_class_name
-                ),
-                None,
-            )
+            top_level_class = getattr(app_module, top_level_class_name, None)
 
-            if not top_level_class:
-                logging.error(
+            if not inspect.isclass(top_level_class):
+                logger.error(
                     f"Top-level API class '{top_level_class_name}' not found in 'proj.apps.{app_name}.api'."
                 )
                 return
@@ -259,30 +647,59 @@ class DSLExecutor:
             api_instance = top_level_class(cursor=self.cursor)
 
             # Register methods from the app-specific API
-            for attr_name in dir(api_instance):
-                attr = getattr(api_instance, attr_name)
-                if inspect.isclass(type(attr)):
-                    methods = inspect.getmembers(
-                        attr, predicate=inspect.ismethod
-                    )
-                    for method_name, method in methods:
-                        key = f"{attr_name.lower()}.{method_name}"
-                        # if the method is a private method or an init method, skip it
-                        if (
-                            method_name.startswith("_")
-                            or method_name == "init"
-                        ):
-                            continue
-                        registry[key] = {"function": method, "source": "app"}
-                        logging.info(
-                            f"Registered app-specific function: {key}"
-                        )
+            for key, method in self._bind_steps(
+                ("app", top_level_class), api_instance
+            ):
+                registry[key] = {"function": method, "source": "app"}
 
         except ImportError as e:
-            logging.error(
+            logger.error(
                 f"App-specific module 'proj.apps.{app_name}.api' not found."
             )
-            logging.debug(traceback.format_exc())
+            logger.debug("Import failure details", exc_info=True)
+
+    def _bind_steps(self, layout_key, instance):
+        """
+        Resolves an API instance's step methods.
+
+        The reflection scan runs once per API class. Its result, each step's
+        namespace attribute and function, is kept in _STEP_LAYOUTS, so later
+        executors just bind the functions to their own namespace instances.
+
+        Args:
+            layout_key (tuple): Identifies the API class the instance belongs to.
+            instance (object): The API instance to bind the steps to.
+
+        Returns:
+            list[tuple]: (registry key, bound method) pairs.
+        """
+        layout = _STEP_LAYOUTS.get(layout_key)
+        if layout is None:
+            layout = _scan_steps(instance)
+            _STEP_LAYOUTS[layout_key] = layout
+            # Logged on the first scan only; later executors bind the same steps
+            for key, _, _ in layout:
+                logger.info("Registered %s function: %s", layout_key[0], key)
+        return [
+            (key, function.__get__(getattr(instance, attr_name)))
+            for key, attr_name, function in layout
+        ]
+
+    def _merged_context(self, additional_context=None):
+        """
+        Layers additional context (e.g. loop variables) over the DSL context.
+
+        Args:
+            additional_context (Mapping, optional): Variables that take
+                precedence over the DSL context.
+
+        Returns:
+            Mapping: A ChainMap view of both, or the DSL context itself when
+                there is nothing to add.
+        """
+        if not additional_context:
+            return self.dsl_context
+        return ChainMap(additional_context, self.dsl_context)
 
     def _resolve_arguments(self, args, additional_context=None):
         """
@@ -297,10 +714,10 @@ class DSLExecutor:
             Any: Resolved arguments with placeholders replaced by their values.
         """
         # Merge global context and additional context if provided
-        context = {**self.dsl_context, **(additional_context or {})}
+        context = self._merged_context(additional_context)
 
         def resolve(value):
-            if isinstance(value, str) and "{" in value and "}" in value:
+            if isinstance(value, str):
                 # Resolve placeholders using the merged context
                 return self._resolve_placeholders(value, context)
             elif isinstance(value, list):
@@ -328,55 +745,74 @@ class DSLExecutor:
         Returns:
             str: Resolved string with evaluated placeholders.
         """
+        # Literal text (most arguments, plain conditions) has nothing to do
+        if isinstance(text, str) and "{" not in text:
+            return text
+
         # Use the provided context or fallback to the DSL context
         context = context or self.dsl_context
 
-        # Define a regex pattern to match placeholders enclosed in curly braces
-        pattern = r"\{([^\}]+)\}"
-
-        # Define a safe evaluation environment
-        safe_globals = {
-            "datetime": __import__(
-                "datetime"
-            ).datetime,  # Import the `datetime.datetime` class
-            "timedelta": __import__(
-                "datetime"
-            ).timedelta,  # Import `timedelta` if needed
-            "abs": abs,  # Add built-in functions as needed
-        }
+        compiled_template = (
+            _compile_template(text) if isinstance(text, str) else None
+        )
+        if compiled_template:
+            template, code = compiled_template
+            try:
+                resolved_text = template % eval(
+                    code, self._safe_globals, context
+                )
+                logger.debug("Resolved text: %s", resolved_text)
+                return resolved_text
+            except Exception:
+                # Resolve one placeholder at a time below, so only the
+                # failing ones are marked and logged
+                pass
 
         def resolve_match(match):
             expression = match.group(
                 1
             )  # Extract the expression inside the curly braces
-            logging.debug(f"Attempting to resolve expression: {expression}")
+            logger.debug("Attempting to resolve expression: %s", expression)
+            lookup = _compile_lookup(expression)
             try:
-                # Evaluate the expression in the safe environment with the given context
-                value = eval(expression, safe_globals, context)
-                logging.debug(f"Resolved '{expression}' to '{value}'")
+                if lookup and lookup[0] in context:
+                    # Plain variable lookup, no need to evaluate it
+                    name, getters = lookup
+                    value = context[name]
+                    for getter in getters:
+                        value = getter(value)
+                else:
+                    # Evaluate the expression in the safe environment with the given context
+                    value = eval(
+                        _compile_expression(expression),
+                        self._safe_globals,
+                        context,
+                    )
+                logger.debug("Resolved '%s' to '%s'", expression, value)
                 return str(value)  # Convert the result to a string
-            except KeyError as e:
-                logging.error(
-                    f"Key error resolving placeholder '{expression}': {e}",
-                    exc_info=True,
+            except (KeyError, NameError) as e:
+                # Expected when a variable is optional or not set yet, so
+                # skip the traceback
+                logger.warning(
+                    "Could not resolve placeholder '%s': missing %s",
+                    expression,
+                    e,
                 )
                 return f"<Unresolved {expression}>"
-            except Exception as e:
-                logging.error(
-                    f"Error resolving placeholder '{expression}': {e}",
-                    exc_info=True,
+            except Exception:
+                logger.exception(
+                    "Error resolving placeholder '%s'", expression
                 )
                 return f"<Error resolving {expression}>"
 
         try:
             # Use regex to find and resolve all placeholders in the string
-            resolved_text = re.sub(pattern, resolve_match, text)
-            logging.debug(f"Resolved text: {resolved_text}")
+            resolved_text = _PLACEHOLDER_PATTERN.sub(resolve_match, text)
+            logger.debug("Resolved text: %s", resolved_text)
             return resolved_text
-        except Exception as e:
-            logging.error(
-                f"Unexpected error resolving placeholders in '{text}': {e}",
-                exc_info=True,
+        except Exception:
+            logger.exception(
+                "Unexpected error resolving placeholders in '%s'", text
             )
             return f"<Error resolving {text}>"
 
@@ -393,28 +829,19 @@ class DSLExecutor:
         """
         context = context or self.dsl_context
 
-        # 1) Create a safe environment with datetime, timedelta, etc.
-        safe_globals = {
-            "datetime": __import__("datetime").datetime,
-            "timedelta": __import__("datetime").timedelta,
-            "abs": abs,
-            # Add other built-ins or imports if we need them
-        }
-
-        logging.debug(f"Attempting to resolve condition: {condition}")
+        logger.debug("Attempting to resolve condition: %s", condition)
         try:
-            # 2) Evaluate the condition using safe_globals (instead of {})
-            result = eval(condition, safe_globals, context)
-            logging.debug(f"Condition '{condition}' resolved to: {result}")
+            # Evaluate the condition in the safe environment (instead of {})
+            result = eval(
+                _compile_expression(condition), self._safe_globals, context
+            )
+            logger.debug("Condition '%s' resolved to: %s", condition, result)
             return bool(result)
-        except KeyError as e:
-            logging.error(
-                f"Key error resolving condition '{condition}': {e}",
-                exc_info=True,
+        except (KeyError, NameError) as e:
+            logger.warning(
+                "Could not resolve condition '%s': missing %s", condition, e
             )
             return False
-        except Exception as e:
-            logging.error(
-                f"Error resolving condition '{condition}': {e}", exc_info=True
-            )
+        except Exception:
+            logger.exception("Error resolving condition '%s'", condition)
             return False
@@ -0,0 +1,24 @@
+class DSLNamespace:
+    """
+    Base class for the API classes whose public methods are DSL steps.
+
+    The executor registers the namespaces it finds among a top-level API
+    instance's attributes, e.g. `SCMAPI.inventory` -> `inventory.check_stock`.
+    """
+
+
+def read_only_step(method):
+    """
+    Marks a step as a pure read of the database.
+
+    Within a task the executor reuses a read-only step's result for identical
+    arguments until a step that may write runs.
+
+    Args:
+        method (function): The step method to mark.
+
+    Returns:
+        function: The same method, flagged with `dsl_read_only`.
+    """
+    method.dsl_read_only = True
+    return method
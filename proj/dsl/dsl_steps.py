@@ -1,4 +1,5 @@
 from proj.config.logging_config import setup_logging
+from proj.dsl.dsl_namespace import DSLNamespace
 import logging
 
 setup_logging()
@@ -10,7 +11,7 @@ class CORE:
         self.message = Message(cursor)
 
 
-class Message:
+class Message(DSLNamespace):
     def __init__(self, cursor):
         self.cursor = cursor
 
@@ -3,7 +3,7 @@ import logging
 import inspect
 from openai import OpenAI
 import re
-import os
+from pathlib import Path
 
 from proj.utils.path_helpers import (
     get_base_prompt_file,
@@ -12,14 +12,25 @@ from proj.utils.path_helpers import (
     get_db_dir,
 )
 from proj.config.logging_config import setup_logging
-from proj.dsl.dsl_executor import DSLExecutor
+from proj.dsl.dsl_executor import DSLExecutor, parse_task
 from proj.utils.env_helpers import get_openai_api_key
 
 setup_logging()
 
-OPENAPI_KEY = get_openai_api_key()
-client = OpenAI(api_key=OPENAPI_KEY)
 GPT_MODEL = "gpt-4o"
+_client = None
+
+
+def _get_client():
+    """Creates the OpenAI client on first use, so importing is cheap."""
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=get_openai_api_key())
+    return _client
+
+
+# Code fences (```yaml or ```) the LLM may wrap its plan in
+_FENCE_PATTERN = re.compile(r"^```(?:yaml)?\n|```$", flags=re.MULTILINE)
 
 
 class Orchestrator:
@@ -30,6 +41,10 @@ class Orchestrator:
         self.db_dir = get_db_dir(app_name)
         self.executor = DSLExecutor(app_name)
         self.dsl_context = self.executor.dsl_context
+        # Rendered function descriptions, keyed by id() of the step registry
+        self._function_descriptions = {}
+        # Contents of the prompt files that don't change between runs
+        self._static_files = {}
 
     def orchestrate_workflow(self, scenario_num):
 
@@ -44,7 +59,7 @@ class Orchestrator:
 
         logging.info("Prompt:\n%s", prompt)
 
-        response = client.chat.completions.create(
+        response = _get_client().chat.completions.create(
             model=GPT_MODEL, messages=[{"role": "user", "content": prompt}]
         )
         dsl_plan = self.clean_llm_output(
@@ -53,13 +68,14 @@ class Orchestrator:
 
         logging.info("Generated DSL Plan:\n%s", dsl_plan)
 
-        # Validate and execute DSL plan
+        # Validate and execute DSL plan, parsing it only once
         try:
-            yaml.safe_load(dsl_plan)
-            logging.info("Executing DSL plan...")
-            self.executor.execute_task(dsl_plan)
+            steps = parse_task(dsl_plan)
         except yaml.YAMLError as e:
             logging.error(f"Error in DSL YAML: {e}")
+            return
+        logging.info("Executing DSL plan...")
+        self.executor.execute_parsed_task(steps)
 
     def assemble_prompt(
         self, db_dir, base_prompt_path, scenario_path, step_registry
@@ -76,9 +92,9 @@ class Orchestrator:
         """
 
         # Assmble content for Prompt
-        base_prompt = self.read_file(base_prompt_path)
+        base_prompt = self.read_static_file(base_prompt_path)
         scenario_details = self.read_file(scenario_path)
-        db_schema = self.read_file(f"{db_dir}/db_schema.md")
+        db_schema = self.read_static_file(f"{db_dir}/db_schema.md")
         step_functions_docstring = self.describe_functions(step_registry)
 
         # Define replacements
@@ -108,6 +124,12 @@ class Orchestrator:
         Returns:
             str: Markdown-formatted string describing each function.
         """
+        # The registry doesn't change for the life of the executor, so its
+        # descriptions are rendered once
+        cached = self._function_descriptions.get(id(step_registry))
+        if cached is not None:
+            return cached
+
         function_descriptions = []
         for name, metadata in step_registry.items():
             # Extract the actual function
@@ -127,7 +149,9 @@ class Orchestrator:
                     f"### {name}\n\nNo valid function found.\n"
                 )
 
-        return "\n".join(function_descriptions)
+        described = "\n".join(function_descriptions)
+        self._function_descriptions[id(step_registry)] = described
+        return described
 
     def _mock_llm_response(self, prompt):
         """Simulates an LLM response for testing purposes."""
@@ -156,13 +180,23 @@ class Orchestrator:
             str: The cleaned output ready for YAML processing.
         """
         # Remove any enclosing triple backticks (e.g., ```yaml or ```).
-        cleaned_output = re.sub(
-            r"^```(?:yaml)?\n|```$", "", llm_output.strip(), flags=re.MULTILINE
-        )
+        cleaned_output = _FENCE_PATTERN.sub("", llm_output.strip())
         return cleaned_output
 
     def read_file(self, file):
-        if not os.path.exists(file):
-            raise FileNotFoundError(f"File not found: {file}")
-        with open(file, "r") as f:
-            return f.read()
+        # Raises FileNotFoundError itself, no need to check first
+        return Path(file).read_text()
+
+    def read_static_file(self, file):
+        """
+        Reads a file that stays the same between runs, e.g. the base prompt.
+
+        Args:
+            file (str): Path to the file.
+
+        Returns:
+            str: The file's contents, read from disk on first use only.
+        """
+        if file not in self._static_files:
+            self._static_files[file] = self.read_file(file)
+        return self._static_files[file]
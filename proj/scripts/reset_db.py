@@ -1,24 +1,34 @@
 import sqlite3
 import os
+import shutil
 from proj.utils.path_helpers import get_db_dir
 
 
-def reset_db():
-    DB_DIR = get_db_dir("scm")
-    DB_SCHEMA_SQL = f"{DB_DIR}/db_schema.sql"
-    DB_FILE = f"{DB_DIR}/scm.db"
+def build_template(schema_path, template_path):
+    """
+    Builds the pristine schema and seed database that resets copy from.
 
-    # Remove the database file if it exists
-    if os.path.exists(DB_FILE):
-        os.remove(DB_FILE)
-        print(f"Existing database at {DB_FILE} removed.")
+    The database is built under a temporary name and moved into place, so an
+    interrupted build never leaves a half-seeded template behind. The name is
+    per process, so parallel test workers can't build into the same file.
+
+    Args:
+        schema_path (str): Path to the schema and seed SQL script.
+        template_path (str): Where to write the template database.
+
+    Returns:
+        None
+    """
+    building_path = f"{template_path}.{os.getpid()}.building"
+    if os.path.exists(building_path):
+        os.remove(building_path)
 
     # Connect to SQLite database (creates the file if it doesn't exist)
-    conn = sqlite3.connect(DB_FILE)
+    conn = sqlite3.connect(building_path)
     cursor = conn.cursor()
 
     # Read and execute the SQL schema and data
-    with open(f"{DB_SCHEMA_SQL}", "r") as schema_file:
+    with open(schema_path, "r") as schema_file:
         schema_sql = schema_file.read()
         cursor.executescript(schema_sql)
 
@@ -26,6 +36,44 @@ def reset_db():
     conn.commit()
     conn.close()
 
+    os.replace(building_path, template_path)
+
+
+def reset_db(db_file=None):
+    """
+    Resets the SCM database to the seeded schema.
+
+    Args:
+        db_file (str, optional): The database file to reset. Defaults to the
+            app's scm.db; tests running in parallel each pass their own.
+
+    Returns:
+        None
+    """
+    DB_DIR = get_db_dir("scm")
+    DB_SCHEMA_SQL = f"{DB_DIR}/db_schema.sql"
+    DB_TEMPLATE = f"{DB_DIR}/scm.template.db"
+    DB_FILE = db_file or f"{DB_DIR}/scm.db"
+
+    # Run the schema script only when the template is missing or stale;
+    # otherwise a reset is a plain file copy
+    if not os.path.exists(DB_TEMPLATE) or os.path.getmtime(
+        DB_TEMPLATE
+    ) < os.path.getmtime(DB_SCHEMA_SQL):
+        build_template(DB_SCHEMA_SQL, DB_TEMPLATE)
+
+    # Remove the database file if it exists
+    if os.path.exists(DB_FILE):
+        os.remove(DB_FILE)
+        print(f"Existing database at {DB_FILE} removed.")
+
+    # Remove WAL sidecar files so they aren't replayed into the new database
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(f"{DB_FILE}{suffix}"):
+            os.remove(f"{DB_FILE}{suffix}")
+
+    shutil.copyfile(DB_TEMPLATE, DB_FILE)
+
     print("Database setup and seeding completed successfully.")
 
 
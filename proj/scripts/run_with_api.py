@@ -1,5 +1,6 @@
 import sqlite3
 from proj.apps.scm.api import SCMAPI
+from proj.utils.db_helpers import tune_connection
 from proj.utils.path_helpers import get_db_file
 from proj.scripts.reset_db import reset_db
 
@@ -9,7 +10,8 @@ reset_db()
 # WARNING! RESETTING DB TO SEED DATA
 
 db_path = get_db_file(APP_NAME)
-conn = sqlite3.connect(db_path)
+conn = sqlite3.connect(db_path, cached_statements=256)
+tune_connection(conn)
 cursor = conn.cursor()
 
 api = SCMAPI(cursor)
@@ -0,0 +1,130 @@
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+# Connection-level tuning for the app databases. WAL lets readers proceed
+# alongside writers and synchronous=NORMAL drops the per-commit fsync that the
+# default rollback journal pays; the larger page cache and memory-mapped I/O
+# keep report scans off the read() path.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Read-only connections can't change the journal mode, and query_only makes
+# any stray write fail instead of taking the write lock.
+READ_ONLY_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def tune_connection(connection):
+    """
+    Applies SQLITE_PRAGMAS to a connection.
+
+    The journal mode can't be switched inside an open transaction, so a
+    connection that is already mid-transaction is left untouched.
+
+    Args:
+        connection (sqlite3.Connection): The connection to configure.
+
+    Returns:
+        None
+    """
+    if connection.in_transaction:
+        return
+    for pragma in SQLITE_PRAGMAS:
+        connection.execute(pragma)
+
+
+def connect_read_only(db_path):
+    """
+    Opens a read-only connection for report queries.
+
+    Under WAL a reader works from its own snapshot and never blocks the
+    writer, but it only sees committed data.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The read-only connection.
+    """
+    connection = sqlite3.connect(
+        f"file:{db_path}?mode=ro", uri=True, cached_statements=256
+    )
+    for pragma in READ_ONLY_PRAGMAS:
+        connection.execute(pragma)
+    return connection
+
+
+class ConnectionPool:
+    """
+    A fixed-size pool of SQLite connections that can be shared between threads.
+
+    Each unit of work checks out its own connection, so concurrent readers
+    don't queue behind a single cursor and a stalled writer only holds its own
+    connection. Bind an app API to the checked-out connection, e.g.:
+
+        pool = ConnectionPool(get_db_file("scm"))
+        with pool.connection() as conn:
+            api = SCMAPI(conn.cursor())
+            api.inventory.allocate_stock("O001")
+    """
+
+    def __init__(self, db_path, size=None):
+        """
+        Opens the pooled connections up front.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+            size (int, optional): Number of connections. Defaults to the CPU count.
+        """
+        self.size = size or os.cpu_count() or 4
+        self._connections = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            conn = sqlite3.connect(
+                db_path, check_same_thread=False, cached_statements=256
+            )
+            tune_connection(conn)
+            self._connections.put(conn)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Checks out a connection for the duration of the block.
+
+        The block is treated as one unit of work: it is committed when the
+        block exits normally and rolled back if it raises, so the connection
+        always goes back to the pool without an open transaction.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free connection.
+                Defaults to waiting indefinitely.
+
+        Returns:
+            sqlite3.Connection: The checked-out connection.
+        """
+        conn = self._connections.get(timeout=timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._connections.put(conn)
+
+    def close(self):
+        """Closes every connection currently in the pool."""
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                break
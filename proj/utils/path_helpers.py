@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -12,32 +13,37 @@ def get_project_dir(*args):
     return os.path.join(BASE_DIR, *args)
 
 
+# The directory getters only ever see a handful of app names, so their paths
+# are built once and cached
+@lru_cache(maxsize=None)
 def get_app_dir(app_name, *args):
     """
     Constructs a path relative to a specific app directory.
     :param app_name: The name of the app (e.g., 'scm', 'franchise').
     :param args: Additional path components relative to the app directory.
-    :return: Absolute path as a string with trailing slash.
+    :return: Absolute path as a string.
     """
     return os.path.join(get_project_dir("apps"), app_name, *args)
 
 
+@lru_cache(maxsize=None)
 def get_prompt_dir(app_name):
     """
     Constructs a path to the prompts folder within an app.
     :param app_name: The name of the app (e.g., 'scm', 'franchise').
-    :return: Absolute path as a string with trailing slash.
+    :return: Absolute path as a string.
     """
-    return f"{get_app_dir(app_name, 'prompts')}/"
+    return get_app_dir(app_name, "prompts")
 
 
+@lru_cache(maxsize=None)
 def get_scenario_dir(app_name):
     """
     Constructs a path to the scenarios folder within an app.
     :param app_name: The name of the app (e.g., 'scm', 'franchise').
-    :return: Absolute path as a string with trailing slash.
+    :return: Absolute path as a string.
     """
-    return f"{get_app_dir(app_name, 'scenarios')}/"
+    return get_app_dir(app_name, "scenarios")
 
 
 def get_scenario_file(app_name, scenario_number):
@@ -52,13 +58,14 @@ def get_scenario_file(app_name, scenario_number):
     )
 
 
+@lru_cache(maxsize=None)
 def get_db_dir(app_name):
     """
     Constructs a path to the database folder of an app.
     :param app_name: The name of the app (e.g., 'scm', 'franchise').
-    :return: Absolute path as a string with trailing slash.
+    :return: Absolute path as a string.
     """
-    return f"{get_app_dir(app_name, 'db')}/"
+    return get_app_dir(app_name, "db")
 
 
 def get_db_file(app_name):
@@ -70,13 +77,14 @@ def get_db_file(app_name):
     return os.path.join(get_db_dir(app_name), f"{app_name}.db")
 
 
+@lru_cache(maxsize=None)
 def get_sample_plans_dir(app_name):
     """
     Constructs a path to the sample plans folder of an app.
     :param app_name: The name of the app (e.g., 'scm', 'franchise').
-    :return: Absolute path as a string with trailing slash.
+    :return: Absolute path as a string.
     """
-    return f"{get_app_dir(app_name, 'sample_plans')}/"
+    return get_app_dir(app_name, "sample_plans")
 
 
 def get_sample_plan_file(app_name, plan_num):
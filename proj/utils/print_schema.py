@@ -1,5 +1,9 @@
-import sqlite3
 import os
+from contextlib import closing
+from itertools import groupby
+from operator import itemgetter
+
+from proj.utils.db_helpers import connect_read_only
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 PARENT_DIR = os.path.dirname(CURRENT_DIR)
@@ -7,9 +11,6 @@ PROMPTS_DIR = f"{PARENT_DIR}/prompts"
 DB_PATH = f"{PARENT_DIR}/scm_db.sqlite"
 
 
-import sqlite3
-
-
 def extract_schema_as_markdown(db_path):
     """
     Extracts the schema of an SQLite database and formats it in Markdown.
@@ -20,35 +21,33 @@ def extract_schema_as_markdown(db_path):
     Returns:
         str: The database schema in Markdown format.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Query to get the schema for all tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = cursor.fetchall()
-
-    schema_output = []
-    for table in tables:
-        table_name = table[0]
-        schema_output.append(f"**Table: {table_name}**\n")
-
-        # Get schema for each table
-        cursor.execute(f"PRAGMA table_info('{table_name}');")
-        columns = cursor.fetchall()
-
-        for col in columns:
-            col_name = col[1]
-            col_type = col[2]
-            is_primary = " PRIMARY KEY" if col[5] else ""
-            is_not_null = " NOT NULL" if col[3] else ""
-            schema_output.append(
-                f"    - {col_name} {col_type}{is_primary}{is_not_null}"
-            )
-
-        schema_output.append("")  # Add a blank line for readability
-
-    conn.close()
-    return "\n".join(schema_output)
+    # Read-only, so inspecting a database can't change it
+    with closing(connect_read_only(db_path)) as conn:
+        # Every table's columns in one query, in table creation order
+        rows = conn.execute(
+            """
+            SELECT m.name, p.name, p.type, p.pk, p."notnull"
+            FROM sqlite_master m
+            JOIN pragma_table_info(m.name) p
+            WHERE m.type = 'table'
+            ORDER BY m.rowid, p.cid
+            """
+        ).fetchall()
+
+    return "\n".join(_schema_lines(rows))
+
+
+def _schema_lines(rows):
+    """
+    Formats (table, column, type, pk, notnull) rows as Markdown lines.
+    """
+    for table_name, columns in groupby(rows, key=itemgetter(0)):
+        yield f"**Table: {table_name}**\n"
+        for _, col_name, col_type, is_pk, not_null in columns:
+            is_primary = " PRIMARY KEY" if is_pk else ""
+            is_not_null = " NOT NULL" if not_null else ""
+            yield f"    - {col_name} {col_type}{is_primary}{is_not_null}"
+        yield ""  # Add a blank line for readability
 
 
 if __name__ == "__main__":
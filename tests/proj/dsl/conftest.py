@@ -0,0 +1,79 @@
+import os
+import sqlite3
+
+import pytest
+
+from proj.scripts.reset_db import reset_db
+from proj.utils.path_helpers import get_db_dir
+
+
+@pytest.fixture(scope="session")
+def _scm_executor():
+    """
+    One SCM executor for the whole session, on a freshly reset database.
+
+    Under pytest-xdist every worker runs its own session, so each gets a
+    database file of its own (e.g. scm_gw0.db) and the workers' resets and
+    writes don't contend for one file.
+
+    Yields the executor together with an in-memory snapshot of the reset
+    database that tests are rolled back to.
+    """
+    # Imported here, so collection doesn't load the executor
+    from proj.dsl.dsl_executor import DSLExecutor
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    db_file = None
+    if worker:
+        db_file = os.path.join(get_db_dir("scm"), f"scm_{worker}.db")
+    reset_db(db_file)
+    executor = DSLExecutor("scm", db_path=db_file)
+    snapshot = sqlite3.connect(":memory:")
+    executor.conn.backup(snapshot)
+    yield executor, snapshot
+    snapshot.close()
+    executor.close()
+    if db_file:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(f"{db_file}{suffix}"):
+                os.remove(f"{db_file}{suffix}")
+
+
+@pytest.fixture
+def dsl_executor(_scm_executor):
+    """
+    The shared SCM executor, with an empty context and the reset database.
+
+    Tasks commit their writes, so a SAVEPOINT can't undo them; instead the
+    database is restored from the session snapshot after the test. The app
+    steps are registered again too, so API-level caches don't outlive the
+    rows they were built from.
+    """
+    executor, _ = _scm_executor
+    executor.dsl_context.clear()
+    yield executor
+    _restore(_scm_executor)
+
+
+@pytest.fixture
+def restore_db(_scm_executor):
+    """
+    Returns a function that puts the shared executor back to the state
+    dsl_executor hands it out in, for tests that run several tasks from the
+    same starting point.
+    """
+
+    def restore():
+        _restore(_scm_executor)
+        _scm_executor[0].dsl_context.clear()
+
+    return restore
+
+
+def _restore(scm_executor):
+    """Rolls the executor's database back to the session snapshot."""
+    executor, snapshot = scm_executor
+    if executor.conn.in_transaction:
+        executor.conn.rollback()
+    snapshot.backup(executor.conn)
+    executor.reset_steps()
@@ -1,21 +1,16 @@
-import pytest
 import yaml
-from proj.dsl.dsl_executor import DSLExecutor
-from proj.scripts.reset_db import reset_db
+from datetime import date
 
 
-@pytest.fixture(scope="module")
-def dsl_executor():
-    """Fixture to initialize DSLExecutor with a reset database."""
-    reset_db()
-    return DSLExecutor("scm")
+def _load_task(task_yaml):
+    """Parses a task once at import, so the tests run it as a dict."""
+    from proj.dsl.dsl_executor import _YAML_LOADER
 
+    return yaml.load(task_yaml, Loader=_YAML_LOADER)
 
-def test_simple_output_resolution(dsl_executor):
-    """
-    Test simple resolution of an output variable from a previous step.
+
+_SIMPLE_OUTPUT_TASK = _load_task(
     """
-    task_yaml = """
     task: Test Simple Output Resolution
     steps:
       - name: Fetch Pending Orders
@@ -29,8 +24,15 @@ def test_simple_output_resolution(dsl_executor):
           message: "The first pending order is {pending_orders[0]}."
         output_var: message_result
     """
+)
+
+
+def test_simple_output_resolution(dsl_executor):
+    """
+    Test simple resolution of an output variable from a previous step.
+    """
     # Execute the task
-    dsl_executor.execute_task(task_yaml)
+    dsl_executor.execute_task(_SIMPLE_OUTPUT_TASK)
 
     # Verify that the output variable resolves correctly
     expected_message = {
@@ -41,11 +43,8 @@ def test_simple_output_resolution(dsl_executor):
     assert dsl_executor.dsl_context["message_result"] == expected_message
 
 
-def test_expression_on_output_var(dsl_executor):
+_OUTPUT_VAR_EXPRESSION_TASK = _load_task(
     """
-    Test resolving an expression involving an output variable from a previous step.
-    """
-    task_yaml = """
     task: Test Expression on Output Variable
     steps:
       - name: Fetch Pending Orders
@@ -59,8 +58,15 @@ def test_expression_on_output_var(dsl_executor):
           message: "Twice the pending orders count is {len(pending_orders) * 2}."
         output_var: message_result
     """
+)
+
+
+def test_expression_on_output_var(dsl_executor):
+    """
+    Test resolving an expression involving an output variable from a previous step.
+    """
     # Execute the task
-    dsl_executor.execute_task(task_yaml)
+    dsl_executor.execute_task(_OUTPUT_VAR_EXPRESSION_TASK)
 
     # Verify that the expression resolves correctly
     expected_message = {
@@ -71,11 +77,8 @@ def test_expression_on_output_var(dsl_executor):
     assert dsl_executor.dsl_context["message_result"] == expected_message
 
 
-def test_expression_with_loop_variable(dsl_executor):
+_LOOP_VARIABLE_TASK = _load_task(
     """
-    Test resolving expressions with loop variables.
-    """
-    task_yaml = """
     task: Test Loop Variable
     steps:
       - name: Fetch Pending Orders
@@ -94,9 +97,16 @@ def test_expression_with_loop_variable(dsl_executor):
               message: "Processing order {order['order_id']}"
             output_var: order_message
     """
+)
+
+
+def test_expression_with_loop_variable(dsl_executor):
+    """
+    Test resolving expressions with loop variables.
+    """
 
     # Execute the task
-    dsl_executor.execute_task(task_yaml)
+    dsl_executor.execute_task(_LOOP_VARIABLE_TASK)
 
     # Assertions
     expected_context = {
@@ -118,28 +128,15 @@ def test_expression_with_loop_variable(dsl_executor):
         },  # Last iteration
     }
 
-    for key, expected_value in expected_context.items():
-        assert (
-            key in dsl_executor.dsl_context
-        ), f"{key} is missing in DSL context."
-        assert dsl_executor.dsl_context[key] == expected_value, (
-            f"Value for {key} did not match.\n"
-            f"Expected: {expected_value}\n"
-            f"Got: {dsl_executor.dsl_context[key]}"
-        )
+    # One comparison; pytest's diff points at the mismatched entries
+    actual_context = {
+        key: dsl_executor.dsl_context.get(key) for key in expected_context
+    }
+    assert actual_context == expected_context
 
 
-def test_expression_with_loop_variable_expression(dsl_executor):
-    """
-    Test resolving expressions with loop variables during iterations.
+_LOOP_VARIABLE_EXPRESSION_TASK = _load_task(
     """
-
-    from datetime import datetime
-
-    # Set today's date for the test
-    dsl_executor.dsl_context["today_date"] = "2025-01-10"  # Mock today's date
-
-    task_yaml = """
     task: Test Loop Variable with Expression
     steps:
     - name: Fetch Pending Orders
@@ -155,12 +152,22 @@ def test_expression_with_loop_variable_expression(dsl_executor):
         - name: Print Delay for Order
           function: message.write_message
           arguments:
-            message: "Order {order['order_id']} was created {abs((datetime.strptime(today_date, '%Y-%m-%d') - datetime.strptime(order['order_date'], '%Y-%m-%d')).days)} days ago."
+            message: "Order {order['order_id']} was created {abs(today_ordinal - datetime.fromisoformat(order['order_date']).toordinal())} days ago."
           output_var: delay_message
     """
+)
+
+
+def test_expression_with_loop_variable_expression(dsl_executor):
+    """
+    Test resolving expressions with loop variables during iterations.
+    """
+    # Set today's date for the test, as a day number so each iteration only
+    # parses the order date
+    dsl_executor.dsl_context["today_ordinal"] = date(2025, 1, 10).toordinal()
 
     # Execute the task
-    dsl_executor.execute_task(task_yaml)
+    dsl_executor.execute_task(_LOOP_VARIABLE_EXPRESSION_TASK)
 
     # Assertions
     expected_context = {
@@ -182,12 +189,127 @@ def test_expression_with_loop_variable_expression(dsl_executor):
         },  # Message for the last iteration
     }
 
-    for key, expected_value in expected_context.items():
-        assert (
-            key in dsl_executor.dsl_context
-        ), f"{key} is missing in DSL context."
-        assert dsl_executor.dsl_context[key] == expected_value, (
-            f"Value for {key} did not match.\n"
-            f"Expected: {expected_value}\n"
-            f"Got: {dsl_executor.dsl_context[key]}"
-        )
+    # One comparison; pytest's diff points at the mismatched entries
+    actual_context = {
+        key: dsl_executor.dsl_context.get(key) for key in expected_context
+    }
+    assert actual_context == expected_context
+
+
+def test_loop_expression_evaluated_per_iteration(dsl_executor):
+    """
+    Test that a placeholder expression inside a loop, which is compiled once
+    and reused, is evaluated against each iteration's loop variable.
+    """
+    messages = []
+
+    def record_message(message):
+        messages.append(message)
+
+    dsl_executor.step_registry["test.record_message"] = {
+        "function": record_message,
+        "source": "app",
+    }
+    # A plain ISO parser in place of datetime.strptime, which interprets
+    # its format string again on every call
+    dsl_executor.dsl_context["parse_ymd"] = date.fromisoformat
+    dsl_executor.dsl_context["today_date"] = "2025-01-10"
+    task = {
+        "task": "Test Loop Expression Per Iteration",
+        "steps": [
+            {
+                "name": "Fetch Pending Orders",
+                "function": "customer_order.get_pending_orders",
+                "arguments": {},
+                "output_var": "pending_orders",
+            },
+            {
+                "name": "Process Each Order with Expression",
+                "loop": {"variable": "order", "over": "{pending_orders}"},
+                "steps": [
+                    {
+                        "name": "Record Delay for Order",
+                        "function": "test.record_message",
+                        "arguments": {
+                            "message": "Order {order['order_id']} is "
+                            "{(parse_ymd(today_date) - parse_ymd(order['order_date'])).days} days old."
+                        },
+                    }
+                ],
+            },
+        ],
+    }
+    try:
+        dsl_executor.execute_task(task)
+    finally:
+        del dsl_executor.step_registry["test.record_message"]
+
+    assert messages == [
+        "Order O001 is 9 days old.",
+        "Order O003 is 7 days old.",
+    ]
+
+
+def test_repeated_read_step_results_are_independent(dsl_executor):
+    """
+    Test that a read step served from the read cache gets its own copy of
+    the result, so changing one output doesn't change the other.
+    """
+    fetch_step = {
+        "name": "Check Components for Product",
+        "function": "component.check_components_for_product",
+        "arguments": {"product_id": "P001"},
+    }
+    dsl_executor.execute_task(
+        {
+            "task": "Test Repeated Read Step",
+            "steps": [
+                {**fetch_step, "output_var": "first_components"},
+                {**fetch_step, "output_var": "second_components"},
+            ],
+        }
+    )
+
+    first = dsl_executor.dsl_context["first_components"]
+    second = dsl_executor.dsl_context["second_components"]
+    assert first == second
+    expected = [dict(row) for row in second]
+    first[0]["component_id"] = "Changed"
+    first.pop()
+    assert second == expected
+
+
+def test_step_cannot_change_cached_task_arguments(dsl_executor):
+    """
+    Test that a step function changing its nested arguments doesn't change
+    the parsed task, which is cached and reused by the next run.
+    """
+    task_yaml = """
+    task: Test Argument Isolation
+    steps:
+      - name: Consume Lines
+        function: test.consume_lines
+        arguments:
+          lines: [{product_id: P001, quantity: 1}]
+        output_var: line_count
+    """
+
+    def consume_lines(lines):
+        count = len(lines)
+        lines[0]["quantity"] = 0
+        lines.clear()
+        return count
+
+    dsl_executor.step_registry["test.consume_lines"] = {
+        "function": consume_lines,
+        "source": "app",
+    }
+    try:
+        dsl_executor.execute_task(task_yaml)
+        dsl_executor.dsl_context.clear()
+        dsl_executor.execute_task(task_yaml)
+    finally:
+        del dsl_executor.step_registry["test.consume_lines"]
+
+    # The second run sees the lines as written in the task
+    assert dsl_executor.dsl_context.get("line_count") == 1
@@ -2,19 +2,14 @@ import pytest
 import yaml
 import inspect
 import logging
-from pprint import pprint
+import os
+import pickle
+import re
 
+logger = logging.getLogger(__name__)
 
-from proj.dsl.dsl_executor import DSLExecutor
-from proj.scripts.reset_db import reset_db
-from proj.apps.scm import api as scm_api_module
-
-
-@pytest.fixture(scope="function")
-def dsl_executor():
-    """Initialize DSLExecutor with a reset database."""
-    reset_db()
-    return DSLExecutor("scm")
+# The fenced YAML block following "DSL Example:" in a docstring
+_DSL_RE = re.compile(r"DSL Example:\s*```(?:yaml)?\n(.*?)```", re.DOTALL)
 
 
 def extract_dsl_examples(module):
@@ -28,6 +23,8 @@ def extract_dsl_examples(module):
     Returns:
         list: A list of tuples (method_name, dsl_task).
     """
+    from proj.dsl.dsl_executor import _YAML_LOADER
+
     dsl_examples = []
 
     # Iterate over all classes in the module
@@ -44,47 +41,126 @@ def extract_dsl_examples(module):
             if method_name == "__init__":
                 continue
             docstring = inspect.getdoc(method)
-            if docstring and "DSL Example" in docstring:
-                try:
-                    # Extract the DSL YAML block from the docstring
-                    dsl_yaml = (
-                        docstring.split("DSL Example:")[1].strip().strip("```")
-                    )
-                    dsl_step = yaml.safe_load(dsl_yaml)
-
-                    # Handle cases where DSL example is a single-step wrapped in a list
-                    if isinstance(dsl_step, list) and len(dsl_step) == 1:
-                        dsl_step = dsl_step[0]
-
-                    # Wrap the DSL step(s) with a task structure
-                    dsl_task = {
-                        "task": f"Test {class_name}.{method_name}",
-                        "steps": [dsl_step],
-                    }
-
-                    logging.info(
-                        f"Found DSL Example in {class_name}.{method_name}: {dsl_task}"
-                    )
-                    dsl_examples.append(
-                        (f"{class_name}.{method_name}", dsl_task)
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Failed to parse DSL example for {class_name}.{method_name}: {e}"
-                    )
+            if not docstring or "DSL Example" not in docstring:
+                continue
+            # Extract the DSL YAML block from the docstring
+            match = _DSL_RE.search(docstring)
+            if not match:
+                continue
+            try:
+                dsl_step = yaml.load(match.group(1), Loader=_YAML_LOADER)
+
+                # Handle cases where DSL example is a single-step wrapped in a list
+                if isinstance(dsl_step, list) and len(dsl_step) == 1:
+                    dsl_step = dsl_step[0]
+
+                # Wrap the DSL step(s) with a task structure
+                dsl_task = {
+                    "task": f"Test {class_name}.{method_name}",
+                    "steps": [dsl_step],
+                }
+
+                logger.info(
+                    "Found DSL Example in %s.%s", class_name, method_name
+                )
+                logger.debug("DSL task: %s", dsl_task)
+                dsl_examples.append((f"{class_name}.{method_name}", dsl_task))
+            except Exception as e:
+                logger.error(
+                    "Failed to parse DSL example for %s.%s: %s",
+                    class_name,
+                    method_name,
+                    e,
+                )
 
     if not dsl_examples:
-        logging.warning("No DSL examples found in the module.")
+        logger.warning("No DSL examples found in the module.")
     return dsl_examples
 
 
-@pytest.mark.parametrize(
-    "method_name,dsl_task", extract_dsl_examples(scm_api_module)
+# Extracted examples are cached here between sessions
+EXAMPLES_CACHE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", ".pytest_cache"
 )
-def test_api_dsl_examples(dsl_executor, method_name, dsl_task):
+
+
+def load_dsl_examples(module):
+    """
+    Returns the DSL examples of a module, extracting them only when the
+    module or this test file changed since the last session.
+
+    Args:
+        module (module): The module to inspect.
+
+    Returns:
+        list: A list of tuples (method_name, dsl_task).
+    """
+    # Keyed on this file too, so changes to the extraction aren't masked.
+    # The key is stored in the one cache file, so stale caches are replaced
+    # rather than left behind.
+    key = tuple(os.path.getmtime(path) for path in (module.__file__, __file__))
+    cache_path = os.path.join(EXAMPLES_CACHE_DIR, "dsl_examples.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, cached_examples = pickle.load(f)
+        if cached_key == key:
+            return cached_examples
+    except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+        pass
+
+    dsl_examples = extract_dsl_examples(module)
+    try:
+        os.makedirs(EXAMPLES_CACHE_DIR, exist_ok=True)
+        # Written under a per-process name and moved into place, so parallel
+        # workers never read a half-written cache
+        partial_path = f"{cache_path}.{os.getpid()}"
+        with open(partial_path, "wb") as f:
+            pickle.dump(
+                (key, dsl_examples), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(partial_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not cache DSL examples: %s", e)
+    return dsl_examples
+
+
+@pytest.fixture(scope="module")
+def dsl_examples():
+    """
+    Loads the SCM API's DSL examples on first use, so runs that deselect the
+    test (e.g. with -k) don't pay for the extraction at collection time.
+    """
+    # Imported here, so collecting the module doesn't load the SCM API
+    from proj.apps.scm import api as scm_api_module
+
+    return load_dsl_examples(scm_api_module)
+
+
+def test_api_dsl_examples(dsl_executor, restore_db, dsl_examples, subtests):
     """
     Tests DSL examples extracted from the SCM API module.
 
+    The examples run as subtests of a single test, so they share one fixture
+    setup while each still passes or fails on its own. Every example starts
+    from the reset database and an empty context, so none depends on the
+    writes of the ones before it.
+
+    Args:
+        dsl_executor (DSLExecutor): The initialized DSLExecutor.
+        restore_db (callable): Restores the reset database.
+        dsl_examples (list): (method_name, dsl_task) tuples to run.
+        subtests (Subtests): Reports each example separately.
+    """
+    for method_name, dsl_task in dsl_examples:
+        with subtests.test(msg=method_name):
+            restore_db()
+            check_dsl_example(dsl_executor, method_name, dsl_task)
+
+
+def check_dsl_example(dsl_executor, method_name, dsl_task):
+    """
+    Executes one DSL example and checks that it produced a step result.
+
     Args:
         dsl_executor (DSLExecutor): The initialized DSLExecutor.
         method_name (str): The name of the API method being tested.
@@ -104,8 +180,9 @@ def test_api_dsl_examples(dsl_executor, method_name, dsl_task):
         ), f"Each step in {method_name} should define a function."
 
     try:
-        # Execute the DSL task using the DSLExecutor
-        dsl_executor.execute_task(yaml.dump(dsl_task))
+        # Execute the DSL task using the DSLExecutor, passing the already
+        # parsed task rather than dumping it back to YAML
+        dsl_executor.execute_task(dsl_task)
     except Exception as e:
         pytest.fail(f"DSL execution failed for method {method_name}: {e}")
 
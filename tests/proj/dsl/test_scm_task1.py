@@ -1,39 +1,34 @@
 import pytest
 import yaml
-from proj.dsl.dsl_executor import DSLExecutor
-from proj.scripts.reset_db import reset_db
 from proj.utils.path_helpers import get_sample_plans_dir
 
 
-@pytest.fixture(scope="module")
-def dsl_executor():
-    """Fixture to initialize DSLExecutor with a reset database."""
-    reset_db()
-    return DSLExecutor("scm")
+@pytest.fixture
+def sample_task_path():
+    """Fixture for the path of a sample multi-step task YAML."""
+    SAMPLE_PLANS_DIR = get_sample_plans_dir("scm")
+    return f"{SAMPLE_PLANS_DIR}/task1.yaml"
 
 
 @pytest.fixture
-def sample_task_yaml():
-    """Fixture to load a sample multi-step task YAML."""
-    SAMPLE_PLANS_DIR = get_sample_plans_dir("scm")
-    PLAN_PATH = f"{SAMPLE_PLANS_DIR}/task1.yaml"
-    with open(PLAN_PATH, "r") as f:
-        return f.read()
+def sample_task(sample_task_path):
+    """Fixture to load a sample multi-step task, parsed with libyaml."""
+    from proj.dsl.dsl_executor import _YAML_LOADER
+
+    with open(sample_task_path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
-def test_multistep_task(dsl_executor, sample_task_yaml):
+def test_multistep_task(dsl_executor, sample_task):
     """
     Test a multi-step DSL task by executing the task and verifying the context outputs.
 
     Args:
         dsl_executor (DSLExecutor): The initialized DSLExecutor.
-        sample_task_yaml (str): The YAML string of the multi-step task.
+        sample_task (dict): The parsed multi-step task.
     """
     # Execute the task
-    dsl_executor.execute_task(sample_task_yaml)
-
-    # Load the task YAML for reference
-    task = yaml.safe_load(sample_task_yaml)
+    dsl_executor.execute_task(sample_task)
 
     # Assertions for context outputs
     expected_outputs = {
@@ -79,12 +74,31 @@ def test_multistep_task(dsl_executor, sample_task_yaml):
         },
     }
 
-    for key, expected_value in expected_outputs.items():
-        assert (
-            key in dsl_executor.dsl_context
-        ), f"{key} is missing in DSL context."
-        assert dsl_executor.dsl_context[key] == expected_value, (
-            f"Value for {key} did not match.\n"
-            f"Expected: {expected_value}\n"
-            f"Got: {dsl_executor.dsl_context[key]}"
-        )
+    # Compared in one go; pytest reports the differing keys on failure
+    actual_outputs = {
+        key: dsl_executor.dsl_context.get(key) for key in expected_outputs
+    }
+    assert actual_outputs == expected_outputs
+
+
+def test_multistep_task_dict_matches_yaml(
+    dsl_executor, restore_db, sample_task, sample_task_path
+):
+    """
+    Test that a task passed as a parsed dict runs the same as its YAML text.
+
+    Args:
+        dsl_executor (DSLExecutor): The initialized DSLExecutor.
+        sample_task (dict): The parsed multi-step task.
+        restore_db (callable): Restores the reset database.
+        sample_task_path (str): Path of the task's YAML file.
+    """
+    dsl_executor.execute_task(sample_task)
+    from_dict = dict(dsl_executor.dsl_context)
+
+    # Run the YAML text against the same starting database
+    restore_db()
+    with open(sample_task_path, "r") as f:
+        dsl_executor.execute_task(f.read())
+
+    assert dsl_executor.dsl_context == from_dict
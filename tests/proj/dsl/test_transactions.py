@@ -0,0 +1,74 @@
+ORDER_COUNT_SQL = "SELECT COUNT(*) FROM Orders"
+
+NEW_ORDER_STEP = {
+    "name": "Create Order",
+    "function": "customer_order.create_order",
+    "arguments": {
+        "customer_id": "C001",
+        "order_details": [{"product_id": "P001", "quantity": 1}],
+    },
+    "output_var": "order_id",
+}
+
+
+def test_failed_step_writes_are_undone(dsl_executor):
+    """
+    Test that a step which fails after writing leaves nothing behind, while
+    the task carries on with its other steps.
+    """
+    conn = dsl_executor.conn
+    orders_before = conn.execute(ORDER_COUNT_SQL).fetchone()[0]
+
+    def write_then_fail():
+        conn.execute(
+            "INSERT INTO Orders (order_id, customer_id, order_date, status) "
+            "VALUES ('OFAIL', 'C001', '2025-01-01', 'Pending')"
+        )
+        raise RuntimeError("failed halfway")
+
+    dsl_executor.step_registry["test.write_then_fail"] = {
+        "function": write_then_fail,
+        "source": "app",
+    }
+    try:
+        dsl_executor.execute_task(
+            {
+                "task": "Test Failed Step",
+                "steps": [
+                    {
+                        "name": "Write Then Fail",
+                        "function": "test.write_then_fail",
+                        "arguments": {},
+                        "output_var": "failed",
+                    },
+                    NEW_ORDER_STEP,
+                ],
+            }
+        )
+    finally:
+        del dsl_executor.step_registry["test.write_then_fail"]
+
+    assert "failed" not in dsl_executor.dsl_context
+    assert (
+        conn.execute(
+            "SELECT COUNT(*) FROM Orders WHERE order_id = 'OFAIL'"
+        ).fetchone()[0]
+        == 0
+    )
+    assert conn.execute(ORDER_COUNT_SQL).fetchone()[0] == orders_before + 1
+
+
+def test_caller_transaction_is_left_open(dsl_executor):
+    """
+    Test that a task run inside the caller's transaction neither commits nor
+    rolls it back.
+    """
+    conn = dsl_executor.conn
+    orders_before = conn.execute(ORDER_COUNT_SQL).fetchone()[0]
+
+    conn.execute("BEGIN IMMEDIATE")
+    dsl_executor.execute_task({"task": "Test", "steps": [NEW_ORDER_STEP]})
+
+    assert conn.in_transaction
+    conn.rollback()
+    assert conn.execute(ORDER_COUNT_SQL).fetchone()[0] == orders_before